@@ -8,6 +8,9 @@ from typing import Any, Awaitable, Iterable, List, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Max streamed tokens buffered ahead of a slow streaming handler
+TOKEN_QUEUE_SIZE = 64
+
 
 class ConcurrencyManager:
     """Manage concurrency limits using an asyncio.Semaphore."""
@@ -39,3 +42,47 @@ class ConcurrencyManager:
                 return await c
 
         return await asyncio.gather(*(_run(c) for c in coros))
+
+
+@asynccontextmanager
+async def forward_tokens(handler: Any, maxsize: int = TOKEN_QUEUE_SIZE):
+    """Deliver streamed tokens to ``handler.on_token_async`` from one task.
+
+    Yields an async token callback for ``generate_completion_streaming``.
+    Tokens pass through a bounded queue, so a fast stream waits on a slow
+    handler instead of piling up one task per token. Tokens that queue up
+    while the handler is busy are joined into one call: a handler keeping
+    up still sees each token as it arrives, while a backlog costs one
+    handler call instead of one per token.
+    On a clean exit the block waits until every queued token has been
+    delivered; handler errors are swallowed so they can't break the stream.
+    """
+    queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=maxsize)
+
+    async def _forward() -> None:
+        while True:
+            batch: List[str] = []
+            token = await queue.get()
+            while token is not None:
+                batch.append(token)
+                if queue.empty():
+                    break
+                token = queue.get_nowait()
+            if batch:
+                try:
+                    await handler.on_token_async("".join(batch))
+                except Exception:
+                    pass
+            if token is None:
+                return
+
+    async def _callback(token: str) -> None:
+        await queue.put(token)
+
+    forwarder = asyncio.create_task(_forward())
+    try:
+        yield _callback
+        await queue.put(None)
+        await forwarder
+    finally:
+        forwarder.cancel()
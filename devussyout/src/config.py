@@ -16,10 +16,18 @@ class HiveMindConfig:
     temperature_jitter: float = 0.1
 
 
+@dataclass
+class ResponseCacheConfig:
+    """Configuration for the in-memory LLM response cache."""
+    enabled: bool = True
+    max_entries: int = 64
+
+
 @dataclass
 class Config:
     """Main configuration object."""
     hivemind: HiveMindConfig = field(default_factory=HiveMindConfig)
+    response_cache: ResponseCacheConfig = field(default_factory=ResponseCacheConfig)
 
 
 def load_config() -> Config:
@@ -8,21 +8,11 @@ from __future__ import annotations
 
 import asyncio
 import json
-import os
-import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Union
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
 from .conversation_history import ConversationHistory, Message, MessageRole
 from .json_extractor import JSONExtractor
 from .stage_coordinator import Stage, StageCoordinator
@@ -9,8 +9,13 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _noop(_old: "Stage", _new: "Stage") -> None:
+    """Default stage-change listener; lets transitions call it unconditionally."""
 
 
 class Stage(str, Enum):
@@ -54,29 +59,73 @@ class Stage(str, Enum):
     @property
     def next_stage(self) -> Optional["Stage"]:
         """Get the next stage in the pipeline."""
-        order = [Stage.INTERVIEW, Stage.DESIGN, Stage.DEVPLAN, Stage.DETAILED, Stage.HANDOFF]
-        try:
-            idx = order.index(self)
-            if idx < len(order) - 1:
-                return order[idx + 1]
-        except ValueError:
-            pass
+        idx = _STAGE_INDEX[self]
+        if idx < len(_STAGE_ORDER) - 1:
+            return _STAGE_ORDER[idx + 1]
         return None
     
     @property
     def prev_stage(self) -> Optional["Stage"]:
         """Get the previous stage in the pipeline."""
-        order = [Stage.INTERVIEW, Stage.DESIGN, Stage.DEVPLAN, Stage.DETAILED, Stage.HANDOFF]
-        try:
-            idx = order.index(self)
-            if idx > 0:
-                return order[idx - 1]
-        except ValueError:
-            pass
+        idx = _STAGE_INDEX[self]
+        if idx > 0:
+            return _STAGE_ORDER[idx - 1]
         return None
 
 
-@dataclass
+# Pipeline order, plus integer index and bit per stage. Completion state is
+# kept as a bitmask so membership and requirement checks are single AND ops.
+_STAGE_ORDER = (Stage.INTERVIEW, Stage.DESIGN, Stage.DEVPLAN, Stage.DETAILED, Stage.HANDOFF)
+_STAGE_INDEX: Dict[Stage, int] = {s: i for i, s in enumerate(_STAGE_ORDER)}
+_STAGE_BIT: Dict[Stage, int] = {s: 1 << i for i, s in enumerate(_STAGE_ORDER)}
+
+
+def _make_advance(src: Stage, dst: Optional[Stage]) -> Callable[["StageCoordinator"], Optional[Stage]]:
+    """Build the transition used by ``advance_stage`` when sitting on ``src``.
+    
+    Each source stage gets its own closure with the source bit and target
+    stage bound in, so advancing is one table lookup plus straight-line code.
+    """
+    if dst is None:
+        return lambda coordinator: None
+    
+    src_bit = _STAGE_BIT[src]
+    
+    def _advance(coordinator: "StageCoordinator") -> Optional[Stage]:
+        mask = coordinator._completed_mask
+        if not mask & src_bit:
+            # Current stage not complete, can't advance
+            return None
+        required = coordinator._stage_configs[dst]._requires_mask
+        if mask & required != required:
+            return None
+        coordinator._current_stage = dst
+        coordinator._on_stage_change(src, dst)
+        return dst
+    
+    return _advance
+
+
+_ADVANCE_ACTION: Dict[Stage, Callable[["StageCoordinator"], Optional[Stage]]] = {
+    s: _make_advance(s, s.next_stage) for s in _STAGE_ORDER
+}
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_cached(prompts_dir: Path, stage: Stage) -> Optional[str]:
+    """Read a stage's prompt file once per process.
+    
+    Coordinators sharing a prompts directory share the same string objects.
+    Returns None when the file doesn't exist. Call ``cache_clear()`` to pick
+    up edited prompt files.
+    """
+    prompt_file = prompts_dir / f"{stage.value}_system_prompt.md"
+    if prompt_file.exists():
+        return prompt_file.read_text(encoding="utf-8")
+    return None
+
+
+@dataclass(slots=True)
 class StageConfig:
     """Configuration for a pipeline stage.
     
@@ -94,6 +143,20 @@ class StageConfig:
     max_tokens: int = 4000
     requires_previous: List[Stage] = field(default_factory=list)
     auto_advance: bool = False
+    _requires_mask: int = field(init=False, repr=False, compare=False, default=0)
+    
+    def __post_init__(self) -> None:
+        self._requires_mask = sum(_STAGE_BIT[s] for s in set(self.requires_previous))
+
+
+# Stage-specific settings: (temperature, max_tokens, requires_previous, auto_advance)
+_STAGE_CONFIG_TEMPLATES: Dict[Stage, Tuple[float, int, Tuple[Stage, ...], bool]] = {
+    Stage.INTERVIEW: (0.7, 2000, (), False),  # User controls when interview is done
+    Stage.DESIGN: (0.5, 4000, (Stage.INTERVIEW,), True),
+    Stage.DEVPLAN: (0.5, 3000, (Stage.DESIGN,), True),
+    Stage.DETAILED: (0.4, 4000, (Stage.DEVPLAN,), True),
+    Stage.HANDOFF: (0.3, 3000, (Stage.DETAILED,), False),
+}
 
 
 class StageCoordinator:
@@ -117,6 +180,15 @@ class StageCoordinator:
             coordinator.advance_stage()
     """
     
+    __slots__ = (
+        "prompts_dir",
+        "_current_stage",
+        "_completed_mask",
+        "_stage_configs",
+        "_stage_outputs",
+        "_on_stage_change",
+    )
+    
     # Default prompts directory relative to this file
     DEFAULT_PROMPTS_DIR = Path(__file__).parent.parent.parent / "prompts"
     
@@ -129,64 +201,28 @@ class StageCoordinator:
         """
         self.prompts_dir = prompts_dir or self.DEFAULT_PROMPTS_DIR
         self._current_stage = Stage.INTERVIEW
-        self._completed_stages: List[Stage] = []
+        self._completed_mask = 0
         self._stage_configs: Dict[Stage, StageConfig] = {}
         self._stage_outputs: Dict[Stage, Any] = {}
-        self._on_stage_change: Optional[Callable[[Stage, Stage], None]] = None
+        self._on_stage_change: Callable[[Stage, Stage], None] = _noop
         
         # Initialize configs
         self._init_stage_configs()
     
     def _init_stage_configs(self) -> None:
         """Initialize configurations for all stages."""
-        for stage in Stage:
-            prompt = self._load_prompt(stage)
-            
-            # Stage-specific settings
-            configs = {
-                Stage.INTERVIEW: StageConfig(
-                    stage=stage,
-                    system_prompt=prompt,
-                    temperature=0.7,
-                    max_tokens=2000,
-                    requires_previous=[],
-                    auto_advance=False,  # User controls when interview is done
-                ),
-                Stage.DESIGN: StageConfig(
-                    stage=stage,
-                    system_prompt=prompt,
-                    temperature=0.5,
-                    max_tokens=4000,
-                    requires_previous=[Stage.INTERVIEW],
-                    auto_advance=True,
-                ),
-                Stage.DEVPLAN: StageConfig(
-                    stage=stage,
-                    system_prompt=prompt,
-                    temperature=0.5,
-                    max_tokens=3000,
-                    requires_previous=[Stage.DESIGN],
-                    auto_advance=True,
-                ),
-                Stage.DETAILED: StageConfig(
-                    stage=stage,
-                    system_prompt=prompt,
-                    temperature=0.4,
-                    max_tokens=4000,
-                    requires_previous=[Stage.DEVPLAN],
-                    auto_advance=True,
-                ),
-                Stage.HANDOFF: StageConfig(
-                    stage=stage,
-                    system_prompt=prompt,
-                    temperature=0.3,
-                    max_tokens=3000,
-                    requires_previous=[Stage.DETAILED],
-                    auto_advance=False,
-                ),
-            }
-            
-            self._stage_configs[stage] = configs.get(stage, StageConfig(stage=stage, system_prompt=prompt))
+        self._stage_configs = {
+            stage: StageConfig(
+                stage=stage,
+                system_prompt=self._load_prompt(stage),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                requires_previous=list(requires_previous),
+                auto_advance=auto_advance,
+            )
+            for stage, (temperature, max_tokens, requires_previous, auto_advance)
+            in _STAGE_CONFIG_TEMPLATES.items()
+        }
     
     def _load_prompt(self, stage: Stage) -> str:
         """Load system prompt for a stage from file.
@@ -197,10 +233,9 @@ class StageCoordinator:
         Returns:
             System prompt text
         """
-        prompt_file = self.prompts_dir / f"{stage.value}_system_prompt.md"
-        
-        if prompt_file.exists():
-            return prompt_file.read_text(encoding="utf-8")
+        prompt = _load_prompt_cached(Path(self.prompts_dir), stage)
+        if prompt is not None:
+            return prompt
         
         # Return default prompts if file doesn't exist
         return self._get_default_prompt(stage)
@@ -308,13 +343,14 @@ The prompt should be executable by an autonomous coding agent.""",
     
     @property
     def completed_stages(self) -> List[Stage]:
-        """Get list of completed stages."""
-        return list(self._completed_stages)
+        """Get list of completed stages in pipeline order."""
+        mask = self._completed_mask
+        return [s for s in _STAGE_ORDER if mask & _STAGE_BIT[s]]
     
     @property
     def is_complete(self) -> bool:
         """Check if all stages are complete."""
-        return Stage.HANDOFF in self._completed_stages
+        return bool(self._completed_mask & _STAGE_BIT[Stage.HANDOFF])
     
     def get_config(self, stage: Optional[Stage] = None) -> StageConfig:
         """Get configuration for a stage.
@@ -392,7 +428,7 @@ The prompt should be executable by an autonomous coding agent.""",
         Returns:
             True if current stage is complete and next stage is available
         """
-        if self._current_stage in self._completed_stages:
+        if self._completed_mask & _STAGE_BIT[self._current_stage]:
             return self._current_stage.next_stage is not None
         return False
     
@@ -405,8 +441,7 @@ The prompt should be executable by an autonomous coding agent.""",
         """
         stage = stage or self._current_stage
         
-        if stage not in self._completed_stages:
-            self._completed_stages.append(stage)
+        self._completed_mask |= _STAGE_BIT[stage]
         
         if output is not None:
             self.set_stage_output(stage, output)
@@ -417,28 +452,7 @@ The prompt should be executable by an autonomous coding agent.""",
         Returns:
             The new current stage, or None if no more stages
         """
-        if self._current_stage not in self._completed_stages:
-            # Current stage not complete, can't advance
-            return None
-        
-        next_stage = self._current_stage.next_stage
-        if next_stage is None:
-            return None
-        
-        # Check requirements
-        config = self.get_config(next_stage)
-        for req in config.requires_previous:
-            if req not in self._completed_stages:
-                return None
-        
-        old_stage = self._current_stage
-        self._current_stage = next_stage
-        
-        # Notify listener
-        if self._on_stage_change:
-            self._on_stage_change(old_stage, next_stage)
-        
-        return next_stage
+        return _ADVANCE_ACTION[self._current_stage](self)
     
     def go_to_stage(self, stage: Stage) -> bool:
         """Jump to a specific stage.
@@ -451,26 +465,23 @@ The prompt should be executable by an autonomous coding agent.""",
         Returns:
             True if successful, False if requirements not met
         """
-        config = self.get_config(stage)
-        
         # Check requirements
-        for req in config.requires_previous:
-            if req not in self._completed_stages:
-                return False
+        required = self._stage_configs[stage]._requires_mask
+        if self._completed_mask & required != required:
+            return False
         
         old_stage = self._current_stage
         self._current_stage = stage
         
         # Notify listener
-        if self._on_stage_change:
-            self._on_stage_change(old_stage, stage)
+        self._on_stage_change(old_stage, stage)
         
         return True
     
     def reset(self) -> None:
         """Reset to initial state."""
         self._current_stage = Stage.INTERVIEW
-        self._completed_stages.clear()
+        self._completed_mask = 0
         self._stage_outputs.clear()
     
     def reset_from_stage(self, stage: Stage) -> None:
@@ -481,29 +492,25 @@ The prompt should be executable by an autonomous coding agent.""",
         Args:
             stage: Stage to reset from
         """
-        order = [Stage.INTERVIEW, Stage.DESIGN, Stage.DEVPLAN, Stage.DETAILED, Stage.HANDOFF]
+        idx = _STAGE_INDEX.get(stage)
+        if idx is None:
+            return
         
-        try:
-            idx = order.index(stage)
-            stages_to_clear = order[idx:]
-            
-            for s in stages_to_clear:
-                if s in self._completed_stages:
-                    self._completed_stages.remove(s)
-                if s in self._stage_outputs:
-                    del self._stage_outputs[s]
-            
-            self._current_stage = stage
-        except ValueError:
-            pass
+        # Keep only the bits for stages before `stage`
+        self._completed_mask &= (1 << idx) - 1
+        for s in _STAGE_ORDER[idx:]:
+            self._stage_outputs.pop(s, None)
+        
+        self._current_stage = stage
     
-    def set_on_stage_change(self, callback: Callable[[Stage, Stage], None]) -> None:
+    def set_on_stage_change(self, callback: Optional[Callable[[Stage, Stage], None]]) -> None:
         """Set callback for stage changes.
         
         Args:
-            callback: Function(old_stage, new_stage) called on stage changes
+            callback: Function(old_stage, new_stage) called on stage changes.
+                     Pass None to remove the current listener.
         """
-        self._on_stage_change = callback
+        self._on_stage_change = callback or _noop
     
     def get_progress(self) -> Dict[str, Any]:
         """Get progress information.
@@ -511,14 +518,14 @@ The prompt should be executable by an autonomous coding agent.""",
         Returns:
             Dictionary with progress data
         """
-        all_stages = list(Stage)
-        completed = len(self._completed_stages)
-        total = len(all_stages)
+        completed_stages = self.completed_stages
+        completed = len(completed_stages)
+        total = len(_STAGE_ORDER)
         
         return {
             "current_stage": self._current_stage.value,
             "current_stage_name": self._current_stage.display_name,
-            "completed_stages": [s.value for s in self._completed_stages],
+            "completed_stages": [s.value for s in completed_stages],
             "completed_count": completed,
             "total_stages": total,
             "progress_percent": int((completed / total) * 100) if total > 0 else 0,
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import inspect
 from typing import Any, Callable, Iterable, List
 
 
@@ -24,9 +25,14 @@ class LLMClient(abc.ABC):
         self.streaming_enabled = getattr(config, "streaming_enabled", False)
 
     @abc.abstractmethod
-    async def generate_completion(self, prompt: str, **kwargs: Any) -> str:
+    async def generate_completion(self, prompt: str, *, independent: bool = False, **kwargs: Any) -> str:
         """Generate a single completion for the provided prompt.
 
+        ``independent=True`` marks the call as one of several deliberate
+        samples of the same prompt (e.g. HiveMind drones). Clients must
+        then neither share its result with other calls nor serve it from
+        a response cache, and must not forward the flag to the provider.
+
         Returns the generated text content from the provider.
         """
 
@@ -55,9 +61,12 @@ class LLMClient(abc.ABC):
 
         return asyncio.run(self.generate_completion(prompt, **kwargs))
 
-    async def generate_completion_streaming(self, prompt: str, callback: Callable[[str], Any], **kwargs: Any) -> str:
-        """Default streaming implementation: simulate by chunking full response."""
-        full_response = await self.generate_completion(prompt, **kwargs)
+    async def generate_completion_streaming(self, prompt: str, callback: Callable[[str], Any], *, independent: bool = False, **kwargs: Any) -> str:
+        """Default streaming implementation: simulate by chunking full response.
+
+        ``independent`` has the same meaning as for generate_completion().
+        """
+        full_response = await self.generate_completion(prompt, independent=independent, **kwargs)
 
         # Import here to avoid circular imports if not needed
         try:
@@ -66,7 +75,10 @@ class LLMClient(abc.ABC):
             simulator = StreamingSimulator()
             await simulator.simulate_streaming(full_response, callback)
         except Exception:
-            # If streaming simulator not available, call callback once
-            callback(full_response)
+            # If streaming simulator not available, call callback once;
+            # async callbacks (e.g. concurrency.forward_tokens) are awaited
+            result = callback(full_response)
+            if inspect.isawaitable(result):
+                await result
 
         return full_response
@@ -2,25 +2,263 @@
 
 This module implements an LLM client that uses the opencode CLI tool
 for generating completions. It supports provider/model selection and
-both synchronous and streaming modes.
+both synchronous and streaming modes. When a ``server_url`` is
+configured, completions are sent over HTTP through a pooled keep-alive
+session instead of spawning the CLI (requires aiohttp).
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import inspect
 import json
-import sys
 import os
-from typing import Any, Callable, Optional
+import re
+import time
+import weakref
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional, Union
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # Fall back to the stdlib codec
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
-# Now import using simple names
 from llm_client import LLMClient
 
+try:
+    import aiohttp
+except ImportError:  # Only needed for the server_url path
+    aiohttp = None  # type: ignore
+
+# Read size for stdout / HTTP body chunks while streaming
+_CHUNK_SIZE = 64 * 1024
+
+# How long to wait for a persistent `opencode serve` worker to report its URL
+_WORKER_START_TIMEOUT = 30
+_WORKER_URL_RE = re.compile(rb"https?://[^\s]+")
+
+_DEFAULT_CACHE_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "devussy" / "llm"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_STREAM_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "text/event-stream, application/json;q=0.9",
+}
+
+
+def _choices_content(data: dict) -> Optional[str]:
+    choices = data.get("choices")
+    if not choices:
+        return None
+    try:
+        choice = choices[0]
+        if isinstance(choice, dict) and "message" in choice:
+            return choice["message"].get("content", "")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        pass
+    return None
+
+
+# Known response shapes, most common (opencode's own {"text": ...}) first:
+# {"text": "..."}, {"content": "..."}, {"message": {"content": "..."}},
+# {"choices": [{"message": {"content": "..."}}]}
+_PAYLOAD_EXTRACTORS: tuple[Callable[[dict], Optional[str]], ...] = (
+    lambda d: d.get("text"),
+    lambda d: d.get("content"),
+    lambda d: d["message"].get("content", "") if isinstance(d.get("message"), dict) else None,
+    _choices_content,
+)
+
+
+def _text_from_payload(data: Any) -> Optional[str]:
+    """Pull the completion text out of a decoded response object.
+    
+    Returns None when the object doesn't match a known response shape.
+    """
+    if not isinstance(data, dict):
+        return None
+    for extract in _PAYLOAD_EXTRACTORS:
+        text = extract(data)
+        if text is not None:
+            return text
+    return None
+
+
+def _delta_text(event: dict) -> Optional[str]:
+    """Pull the incremental text out of a streamed (SSE) delta event.
+    
+    Handles ``{"delta": {"text": "..."}}`` and
+    ``{"choices": [{"delta": {"content": "..."}}]}``.
+    """
+    delta = event.get("delta")
+    if delta is None:
+        try:
+            delta = event["choices"][0]["delta"]
+        except (KeyError, IndexError, TypeError):
+            return None
+    if isinstance(delta, dict):
+        return delta.get("text") or delta.get("content") or None
+    return None
+
+
+def _text_from_event(event: dict) -> Optional[str]:
+    """Pull text out of one opencode ``--format json`` event.
+    
+    Events look like ``{"type": "text", "part": {"type": "text", "text": "..."}}``;
+    non-text events (step_start, tool_use, ...) yield None.
+    """
+    part = event.get("part")
+    if isinstance(part, dict):
+        if event.get("type") == "text":
+            return part.get("text") or None
+        return None
+    if "delta" in event or "choices" in event:
+        text = _delta_text(event)
+        if text is not None:
+            return text
+    return _text_from_payload(event) or None
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a stream of byte chunks into lines (without the newline)."""
+    pending = bytearray()
+    async for chunk in chunks:
+        pending += chunk
+        start = 0
+        while True:
+            nl = pending.find(b"\n", start)
+            if nl < 0:
+                break
+            yield bytes(pending[start:nl])
+            start = nl + 1
+        del pending[:start]
+    if pending:
+        yield bytes(pending)
+
+
+async def _iter_reader(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Yield chunks from a subprocess pipe until EOF."""
+    while True:
+        chunk = await reader.read(_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _call_callback(callback: Callable[[str], Any], text: str) -> None:
+    """Invoke a sync or async streaming callback, ignoring its errors."""
+    try:
+        result = callback(text)
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        # Don't let callback errors break the flow
+        pass
+
+
+def _load_event(line: bytes) -> Optional[dict]:
+    """Decode a stripped line holding a JSON object, else return None."""
+    if line[:1] != b"{":
+        return None
+    try:
+        event = _json_loads(line)
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+class _StreamCollector:
+    """Collects completion text from opencode output as it arrives.
+    
+    Output whose first non-blank line is an opencode ``--format json``
+    event (a JSON object with ``type``/``part``) is read as an event stream:
+    each event's text is forwarded to the callback immediately and event
+    lines without text are dropped. Any other output is kept exactly as
+    received, blank lines and indentation included, and handed to the
+    response extractor whole once the stream ends.
+    
+    With ``sse`` set, lines are Server-Sent Events: only ``data:`` fields
+    are read and their texts are token deltas, joined without separators.
+    """
+    
+    __slots__ = ("_callback", "_parts", "_raw", "_events", "sse")
+    
+    def __init__(self, callback: Optional[Callable[[str], Any]] = None):
+        self._callback = callback
+        self._parts: list[str] = []
+        self._raw: list[bytes] = []
+        # None until the first non-blank line shows what the output is
+        self._events: Optional[bool] = None
+        self.sse = False
+    
+    async def feed(self, line: bytes) -> None:
+        if self.sse:
+            line = line.strip()
+            # Skip event:/id:/retry: fields and ":" comments
+            if line[:5] != b"data:":
+                return
+            line = line[5:].lstrip()
+            if not line or line == b"[DONE]":
+                return
+            event = _load_event(line)
+            if event is None:
+                self._raw.append(line)
+            else:
+                await self._add_event(event)
+            return
+        
+        if self._events is False:
+            self._raw.append(line)
+            return
+        stripped = line.strip()
+        if not stripped:
+            if self._events is None:
+                self._raw.append(line)
+            return
+        event = _load_event(stripped)
+        if self._events is None:
+            self._events = event is not None and ("type" in event or "part" in event)
+            if not self._events:
+                self._raw.append(line)
+                return
+        if event is None:
+            self._raw.append(line)
+        else:
+            await self._add_event(event)
+    
+    async def _add_event(self, event: dict) -> None:
+        text = _text_from_event(event)
+        if text:
+            self._parts.append(text)
+            await self._emit(text)
+    
+    @property
+    def has_callback(self) -> bool:
+        return self._callback is not None
+    
+    async def _emit(self, text: str) -> None:
+        if self._callback is not None:
+            await _call_callback(self._callback, text)
+    
+    async def finish(self, extract: Callable[[bytes], str]) -> str:
+        """Return the full text, falling back to ``extract`` on raw output."""
+        if self._parts:
+            return ("" if self.sse else "\n").join(self._parts)
+        text = extract(b"\n".join(self._raw).strip())
+        if text:
+            await self._emit(text)
+        return text
+
 
 class OpenCodeConfig:
     """Configuration for OpenCode LLM client."""
@@ -32,12 +270,22 @@ class OpenCodeConfig:
         streaming_enabled: bool = False,
         max_concurrent_requests: int = 3,
         timeout: int = 300,
+        server_url: str = "",
+        persistent_worker: bool = False,
+        cache_enabled: bool = False,
+        cache_ttl: int = 24 * 3600,
+        cache_dir: str = "",
     ):
         self.provider = provider
         self.model = model
         self.streaming_enabled = streaming_enabled
         self.max_concurrent_requests = max_concurrent_requests
         self.timeout = timeout
+        self.server_url = server_url
+        self.persistent_worker = persistent_worker
+        self.cache_enabled = cache_enabled
+        self.cache_ttl = cache_ttl
+        self.cache_dir = cache_dir
 
 
 class OpenCodeLLMClient(LLMClient):
@@ -49,11 +297,22 @@ class OpenCodeLLMClient(LLMClient):
     - Model selection
     - JSON format output parsing
     - Timeout handling
+    - Optional HTTP server mode with a pooled keep-alive session
+    - Optional persistent ``opencode serve`` worker that CLI runs attach to
+    - Optional on-disk response cache keyed by (model, prompt)
     
     Example usage:
         config = OpenCodeConfig(provider="anthropic", model="claude-sonnet-4")
         client = OpenCodeLLMClient(config)
         response = await client.generate_completion("Write hello world in Python")
+    
+    In server mode, close the pooled session when done, either with
+    ``await client.aclose()`` or by using the client as an async context
+    manager.
+    
+    At most ``max_concurrent_requests`` completions run at once per client;
+    pipeline stages should share a single client so the limit applies
+    across all of them.
     """
 
     def __init__(self, config: Optional[OpenCodeConfig] = None, provider: str = "", model: str = ""):
@@ -73,6 +332,68 @@ class OpenCodeLLMClient(LLMClient):
         self.model = model or getattr(config, 'model', '')
         self.timeout = getattr(config, 'timeout', 300)
         self.streaming_enabled = getattr(config, 'streaming_enabled', False)
+        self.max_concurrent_requests = getattr(config, 'max_concurrent_requests', 3) or 3
+        self.server_url = getattr(config, 'server_url', '')
+        
+        # Model string, CLI command and request-body prefix only depend on
+        # provider/model, so build them once
+        self._full_model = self._build_model_string()
+        self._cached_cmd: tuple[str, ...] = ("opencode", "run", "--format", "json") + (
+            ("--model", self._full_model) if self._full_model else ()
+        )
+        self._payload_prefix = (
+            b'{"model":' + _json_dumps(self._full_model) + b',"prompt":'
+            if self._full_model
+            else b'{"prompt":'
+        )
+        
+        # Pooled HTTP session for server mode, bound to the loop that created it
+        self._session: Optional[Any] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Caps in-flight subprocesses/requests at max_concurrent_requests.
+        # Created lazily so it belongs to the loop that uses it.
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Long-lived `opencode serve` process that CLI runs attach to, so
+        # each completion skips opencode's own startup
+        self.persistent_worker = getattr(config, 'persistent_worker', False)
+        self._worker: Optional[asyncio.subprocess.Process] = None
+        self._worker_url = ""
+        self._worker_failed = False
+        self._worker_lock: Optional[asyncio.Lock] = None
+        self._worker_drain: Optional[asyncio.Future] = None
+        
+        # Responses are cached on disk as <blake2b(model, prompt)>.json;
+        # cache_ttl is in seconds, 0 keeps entries forever
+        self.cache_enabled = getattr(config, 'cache_enabled', False)
+        self.cache_ttl = getattr(config, 'cache_ttl', 24 * 3600)
+        self.cache_dir = Path(getattr(config, 'cache_dir', '') or _DEFAULT_CACHE_DIR)
+        self._cache_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        
+        # Completions currently running, by request key, so identical
+        # concurrent prompts share one LLM call
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "OpenCodeLLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _build_model_string(self) -> str:
+        """Build the model string (provider/model or just model)."""
+        if not self.model:
+            return ""
+        if "/" in self.model:
+            # Model already includes provider
+            return self.model
+        if self.provider:
+            return f"{self.provider}/{self.model}"
+        return self.model
 
     def _build_command(self) -> list[str]:
         """Build the opencode command with appropriate flags.
@@ -80,29 +401,182 @@ class OpenCodeLLMClient(LLMClient):
         Returns:
             List of command arguments for subprocess.
         """
-        cmd = ["opencode", "run", "--format", "json"]
-        
-        # Build model string (provider/model or just model)
-        full_model = ""
-        if self.model:
-            if "/" in self.model:
-                # Model already includes provider
-                full_model = self.model
-            elif self.provider:
-                full_model = f"{self.provider}/{self.model}"
-            else:
-                full_model = self.model
+        return list(self._cached_cmd)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.Semaphore(self.max_concurrent_requests)
+            self._sem_loop = loop
+        return self._sem
+
+    async def _get_session(self) -> Any:
+        """Return the pooled aiohttp session, creating it on first use.
+        
+        The session is rebuilt if the running event loop changed (e.g. after
+        a separate ``asyncio.run`` call), since sessions are loop-bound.
+        """
+        if aiohttp is None:
+            raise RuntimeError(
+                "aiohttp is required when server_url is set. Install it with: pip install aiohttp"
+            )
+        
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_requests,
+                limit_per_host=self.max_concurrent_requests,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Connection": "keep-alive"},
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def warmup(self, connections: Optional[int] = None) -> None:
+        """Pre-open pooled connections to ``server_url``.
         
-        if full_model:
-            cmd.extend(["--model", full_model])
+        Issues cheap HEAD requests so the TCP/TLS handshakes happen before
+        the first real completion instead of inside it. Response status is
+        ignored and failures are swallowed; warmup is best-effort. No-op
+        when no server_url is configured.
         
-        return cmd
+        Args:
+            connections: Number of connections to prime in parallel.
+                        Defaults to max_concurrent_requests.
+        """
+        if not self.server_url:
+            return
+        
+        session = await self._get_session()
+        count = max(1, min(connections or self.max_concurrent_requests, self.max_concurrent_requests))
+        
+        async def _head() -> None:
+            try:
+                async with session.head(self.server_url, allow_redirects=False):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+        
+        await asyncio.gather(*(_head() for _ in range(count)))
 
-    async def generate_completion(self, prompt: str, **kwargs: Any) -> str:
+    async def _ensure_worker(self) -> str:
+        """Start the persistent ``opencode serve`` worker on first use.
+        
+        Returns:
+            The worker URL to attach to, or "" if it couldn't be started
+            (completions then fall back to standalone CLI runs).
+        """
+        if self._worker_url or self._worker_failed:
+            return self._worker_url
+        
+        if self._worker_lock is None:
+            self._worker_lock = asyncio.Lock()
+        
+        async with self._worker_lock:
+            if self._worker_url or self._worker_failed:
+                return self._worker_url
+            
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "opencode", "serve", "--hostname", "127.0.0.1", "--port", "0",
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                )
+            except FileNotFoundError:
+                self._worker_failed = True
+                return ""
+            
+            async def _read_url() -> str:
+                while True:
+                    line = await process.stdout.readline()
+                    if not line:
+                        return ""
+                    m = _WORKER_URL_RE.search(line)
+                    if m:
+                        return m.group(0).decode('utf-8').rstrip("/")
+            
+            try:
+                url = await asyncio.wait_for(_read_url(), timeout=_WORKER_START_TIMEOUT)
+            except asyncio.TimeoutError:
+                url = ""
+            
+            if not url:
+                self._worker_failed = True
+                await self._stop_process(process)
+                return ""
+            
+            # Keep draining the worker's log output so its pipe never fills
+            self._worker_drain = asyncio.ensure_future(self._drain(process.stdout))
+            self._worker = process
+            self._worker_url = url
+            return url
+
+    @staticmethod
+    async def _drain(reader: asyncio.StreamReader) -> None:
+        """Read and discard a pipe until EOF."""
+        async for _ in _iter_reader(reader):
+            pass
+
+    @staticmethod
+    async def _stop_process(process: asyncio.subprocess.Process) -> None:
+        """Terminate a child process, escalating to kill if it lingers."""
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    async def _kill_process(process: asyncio.subprocess.Process) -> None:
+        """Kill a child process immediately and reap it."""
+        if process.returncode is not None:
+            return
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP session and stop the worker, if started."""
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+        
+        worker, self._worker = self._worker, None
+        self._worker_url = ""
+        if self._worker_drain is not None:
+            self._worker_drain.cancel()
+            self._worker_drain = None
+        if worker is not None:
+            await self._stop_process(worker)
+
+    async def generate_completion(
+        self,
+        prompt: Union[str, bytes],
+        *,
+        independent: bool = False,
+        **kwargs: Any
+    ) -> str:
         """Generate a completion using opencode CLI.
         
         Args:
-            prompt: The prompt to send to the LLM
+            prompt: The prompt to send to the LLM (str, or already
+                    UTF-8 encoded bytes)
+            independent: Always issue a fresh request, neither sharing an
+                         identical in-flight one nor reading or writing
+                         the response cache
             **kwargs: Additional arguments (currently unused)
             
         Returns:
@@ -112,7 +586,150 @@ class OpenCodeLLMClient(LLMClient):
             RuntimeError: If opencode command fails
             ValueError: If response parsing fails
         """
+        return await self._complete(prompt, independent=independent)
+
+    async def _complete(
+        self,
+        prompt: Union[str, bytes],
+        callback: Optional[Callable[[str], Any]] = None,
+        independent: bool = False,
+    ) -> str:
+        """Run a completion, sharing the result with identical in-flight calls.
+        
+        While a prompt is in flight, further calls with the same (model,
+        prompt) key await its result instead of issuing their own request.
+        Independent samples of the same prompt bypass both in-flight
+        sharing and the disk cache.
+        """
+        if independent:
+            return await self._run_completion(prompt, callback)
+        
+        key = self._request_key(prompt)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                text = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The call we were waiting on was cancelled, not us; run
+                # the request ourselves
+                return await self._complete(prompt, callback)
+            if callback is not None:
+                await _call_callback(callback, text)
+            return text
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text = await self._cached_completion(key, prompt, callback)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a future nobody else awaited doesn't warn
+            future.exception()
+            raise
+        else:
+            future.set_result(text)
+            return text
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _request_key(self, prompt: Union[str, bytes]) -> str:
+        """Hash (model, prompt) into the key shared by dedup and the disk cache."""
+        if isinstance(prompt, str):
+            prompt = prompt.encode('utf-8')
+        return hashlib.blake2b(
+            self._full_model.encode('utf-8') + b"\0" + prompt, digest_size=16
+        ).hexdigest()
+
+    async def _cached_completion(
+        self,
+        key: str,
+        prompt: Union[str, bytes],
+        callback: Optional[Callable[[str], Any]] = None,
+    ) -> str:
+        """Run a completion, serving it from the response cache when enabled."""
+        if not self.cache_enabled:
+            return await self._run_completion(prompt, callback)
+        
+        path = self.cache_dir / f"{key}.json"
+        
+        # One lock per key, so concurrent identical prompts wait for the
+        # first one to fill the cache instead of all calling the LLM
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        
+        async with lock:
+            text = self._cache_get(path)
+            if text is not None:
+                if callback is not None:
+                    await _call_callback(callback, text)
+                return text
+            text = await self._run_completion(prompt, callback)
+            if text:
+                self._cache_put(path, text)
+            return text
+
+    def _cache_get(self, path: Path) -> Optional[str]:
+        """Return the cached text at ``path``, or None if missing or expired."""
+        try:
+            if self.cache_ttl and time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            data = _json_loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        text = data.get("text") if isinstance(data, dict) else None
+        return text if isinstance(text, str) else None
+
+    def _cache_put(self, path: Path, text: str) -> None:
+        """Write ``text`` to the cache atomically; failures are ignored."""
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(_json_dumps({"model": self._full_model, "text": text}))
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+
+    async def _run_completion(
+        self,
+        prompt: Union[str, bytes],
+        callback: Optional[Callable[[str], Any]] = None,
+    ) -> str:
+        """Run a completion, forwarding text to ``callback`` as it streams in."""
+        collector = _StreamCollector(callback)
+        # Convert the prompt to the transport's form exactly once, before
+        # taking a concurrency slot: the server path needs str for the JSON
+        # body, the CLI path writes raw bytes to stdin
+        if self.server_url:
+            if isinstance(prompt, bytes):
+                prompt = prompt.decode('utf-8')
+            async with self._get_semaphore():
+                await self._generate_via_server(prompt, collector)
+        else:
+            if isinstance(prompt, str):
+                prompt = prompt.encode('utf-8')
+            async with self._get_semaphore():
+                await self._generate_via_subprocess(prompt, collector)
+        return await collector.finish(self._extract_text_from_response)
+
+    async def _generate_via_subprocess(self, prompt: bytes, collector: _StreamCollector) -> None:
+        """Run ``opencode run`` and feed its stdout to ``collector`` line by line.
+        
+        Raises:
+            RuntimeError: If opencode is missing, fails or times out
+        """
         cmd = self._build_command()
+        if self.persistent_worker:
+            worker_url = await self._ensure_worker()
+            if worker_url:
+                cmd.extend(["--attach", worker_url])
         
         try:
             process = await asyncio.create_subprocess_exec(
@@ -121,42 +738,100 @@ class OpenCodeLLMClient(LLMClient):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            
-            # Send prompt via stdin and wait for completion
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(prompt.encode('utf-8')),
-                timeout=self.timeout
+        except FileNotFoundError:
+            raise RuntimeError(
+                "opencode command not found. Ensure opencode is installed and in PATH."
             )
-            
-            exit_code = process.returncode
-            
-            if exit_code != 0:
-                error_msg = stderr.decode('utf-8') if stderr else "Unknown error"
-                raise RuntimeError(
-                    f"opencode failed with exit code {exit_code}: {error_msg[:500]}"
-                )
-            
-            # Parse JSON response
-            output_text = stdout.decode('utf-8').strip()
-            return self._extract_text_from_response(output_text)
-            
+        
+        async def _send_prompt() -> None:
+            process.stdin.write(prompt)
+            await process.stdin.drain()
+            process.stdin.close()
+        
+        async def _run() -> bytes:
+            # Send prompt via stdin while draining stdout/stderr, so a full
+            # pipe on either side can't deadlock the child
+            stdin_task = asyncio.ensure_future(_send_prompt())
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+            try:
+                async for line in _iter_lines(_iter_reader(process.stdout)):
+                    await collector.feed(line)
+                await stdin_task
+                await process.wait()
+                return await stderr_task
+            finally:
+                stdin_task.cancel()
+                stderr_task.cancel()
+        
+        # On timeout or cancellation the child must not outlive the call;
+        # kill it right away so the semaphore slot isn't held by an orphan
+        try:
+            stderr = await asyncio.wait_for(_run(), timeout=self.timeout)
         except asyncio.TimeoutError:
+            await self._kill_process(process)
             raise RuntimeError(
                 f"opencode command timed out after {self.timeout} seconds"
             )
-        except FileNotFoundError:
+        except asyncio.CancelledError:
+            await self._kill_process(process)
+            raise
+        
+        exit_code = process.returncode
+        if exit_code != 0:
+            error_msg = stderr.decode('utf-8', errors='replace') if stderr else "Unknown error"
             raise RuntimeError(
-                "opencode command not found. Ensure opencode is installed and in PATH."
+                f"opencode failed with exit code {exit_code}: {error_msg[:500]}"
+            )
+
+    async def _generate_via_server(self, prompt: str, collector: _StreamCollector) -> None:
+        """POST the prompt to ``server_url`` and feed the body to ``collector``.
+        
+        Reuses the pooled session so consecutive calls skip the TCP/TLS
+        handshake. The body is consumed in chunks, so JSONL event streams
+        are forwarded as they arrive. Streaming calls (those with a
+        callback) ask for ``text/event-stream`` and are parsed as SSE
+        when the server honours it.
+        
+        Raises:
+            RuntimeError: If the request fails or times out
+        """
+        session = await self._get_session()
+        
+        body = self._payload_prefix + _json_dumps(prompt) + b"}"
+        headers = _STREAM_HEADERS if collector.has_callback else _JSON_HEADERS
+        
+        try:
+            async with session.post(self.server_url, data=body, headers=headers) as response:
+                if response.status >= 400:
+                    body = await response.read()
+                    raise RuntimeError(
+                        f"opencode server returned HTTP {response.status}: "
+                        f"{body[:500].decode('utf-8', errors='replace')}"
+                    )
+                collector.sse = response.content_type == "text/event-stream"
+                try:
+                    async for line in _iter_lines(response.content.iter_chunked(_CHUNK_SIZE)):
+                        await collector.feed(line)
+                except asyncio.CancelledError:
+                    # Drop the half-read connection instead of returning it
+                    # to the pool
+                    response.close()
+                    raise
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                f"opencode server request timed out after {self.timeout} seconds"
             )
+        except aiohttp.ClientError as e:
+            raise RuntimeError(f"opencode server request failed: {e}")
 
-    def _extract_text_from_response(self, response: str) -> str:
+    def _extract_text_from_response(self, response: Union[str, bytes]) -> str:
         """Extract text content from opencode JSON response.
         
         The opencode CLI with --format json returns a JSON object
         with a "text" field containing the LLM response.
         
         Args:
-            response: Raw JSON string from opencode
+            response: Raw JSON from opencode, as str or undecoded bytes
             
         Returns:
             Extracted text content
@@ -167,84 +842,75 @@ class OpenCodeLLMClient(LLMClient):
         if not response:
             return ""
         
-        try:
-            # Try to parse as JSON
-            data = json.loads(response)
-            
-            # Handle different response formats
-            if isinstance(data, dict):
-                # Standard format: {"text": "..."}
-                if "text" in data:
-                    return data["text"]
-                # Alternative format: {"content": "..."}
-                if "content" in data:
-                    return data["content"]
-                # Alternative format: {"message": {"content": "..."}}
-                if "message" in data and isinstance(data["message"], dict):
-                    return data["message"].get("content", "")
-                # Alternative format: {"choices": [{"message": {"content": "..."}}]}
-                if "choices" in data and data["choices"]:
-                    choice = data["choices"][0]
-                    if isinstance(choice, dict) and "message" in choice:
-                        return choice["message"].get("content", "")
-            
-            # If we couldn't extract text, return raw response
+        # Only a JSON object can carry one of the known shapes; skip the
+        # decoder entirely for plain-text replies
+        if response[:1] not in (b"{", "{"):
+            if isinstance(response, bytes):
+                return response.decode('utf-8', errors='replace')
             return response
-            
-        except json.JSONDecodeError:
+        
+        try:
+            # Try to parse as JSON (orjson decodes bytes natively)
+            text = _text_from_payload(_json_loads(response))
+            if text is not None:
+                return text
+        except ValueError:
             # If not valid JSON, return as-is (might be plain text)
-            return response
+            pass
+        
+        # If we couldn't extract text, return raw response
+        if isinstance(response, bytes):
+            return response.decode('utf-8', errors='replace')
+        return response
 
     async def generate_completion_streaming(
         self,
-        prompt: str,
+        prompt: Union[str, bytes],
         callback: Callable[[str], Any],
+        *,
+        independent: bool = False,
         **kwargs: Any
     ) -> str:
         """Generate completion with streaming callback.
         
-        Note: opencode CLI streaming support is limited.
-        This implementation falls back to non-streaming and calls
-        the callback once with the full response.
+        opencode's ``--format json`` output is a stream of JSON events; the
+        text of each event is passed to the callback as soon as its line
+        arrives. In server mode the request asks for Server-Sent Events
+        and each token delta is forwarded as it arrives. Output without
+        events is delivered in a single call at the end.
         
         Args:
             prompt: The prompt to send
-            callback: Function to call with streamed tokens
-            **kwargs: Additional arguments
+            callback: Function (sync or async) to call with streamed text
+            independent: See generate_completion
+            **kwargs: Additional arguments (see generate_completion)
             
         Returns:
             The complete generated text
         """
-        # For now, use non-streaming as fallback
-        # opencode may not support true streaming via CLI
-        text = await self.generate_completion(prompt, **kwargs)
-        
-        if callback:
-            try:
-                # Check if callback is async
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(text)
-                else:
-                    callback(text)
-            except Exception:
-                # Don't let callback errors break the flow
-                pass
-        
-        return text
+        return await self._complete(prompt, callback, independent=independent)
 
 
 # Convenience function for quick client creation
 def create_opencode_client(
     provider: str = "",
     model: str = "",
-    timeout: int = 300
+    timeout: int = 300,
+    server_url: str = "",
+    cache_enabled: bool = False,
 ) -> OpenCodeLLMClient:
     """Create an OpenCode LLM client with the given settings.
     
+    When using server_url, callers should ``await client.warmup()`` right
+    after construction so the first pipeline stage doesn't pay for
+    connection setup.
+    
     Args:
         provider: LLM provider (anthropic, openai, etc.)
         model: Model name
         timeout: Timeout in seconds
+        server_url: Optional opencode server endpoint to use instead of the CLI
+        cache_enabled: Serve repeated prompts from the on-disk response cache
         
     Returns:
         Configured OpenCodeLLMClient instance
@@ -252,6 +918,8 @@ def create_opencode_client(
     config = OpenCodeConfig(
         provider=provider,
         model=model,
-        timeout=timeout
+        timeout=timeout,
+        server_url=server_url,
+        cache_enabled=cache_enabled,
     )
     return OpenCodeLLMClient(config)
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProjectDesign(BaseModel):
@@ -54,6 +54,10 @@ class TaskGroup(BaseModel):
     2. Lock all estimated_files for the duration
     3. Minimize file conflicts between parallel workers
     """
+    # Groups are never reassigned after parsing; freezing guards the swarm
+    # scheduler's file locks against accidental edits.
+    model_config = ConfigDict(frozen=True)
+
     group_number: int = Field(description="Sequential group number within a phase")
     description: str = Field(description="Brief description of this task group")
     estimated_files: List[str] = Field(
@@ -90,7 +94,7 @@ class DevPlan(BaseModel):
     phases: List[DevPlanPhase] = Field(default_factory=list)
     summary: Optional[str] = None
     raw_basic_response: Optional[str] = Field(default=None, description="Full raw markdown from basic devplan generation")
-    raw_detailed_responses: Optional[Dict[int, str]] = Field(default=None, description="Raw markdown for each phase detail")
+    raw_detailed_responses: Optional[Dict[int, str]] = Field(default_factory=dict, description="Raw markdown for each phase detail")
 
     def to_json(self) -> str:
         return self.model_dump_json(indent=2)
@@ -103,6 +107,8 @@ class DevPlan(BaseModel):
 class HandoffPrompt(BaseModel):
     """The final handoff prompt document and metadata."""
 
+    model_config = ConfigDict(frozen=True)
+
     content: str
     next_steps: List[str] = Field(default_factory=list)
 
@@ -5,24 +5,105 @@ from __future__ import annotations
 import asyncio
 import re
 import json
-import sys
 import os
 from typing import Any, Optional, List
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Fall back to the stdlib codec
+    _json_loads = json.loads
 
-# Now import using simple names (works both as package and standalone)
+try:
+    import re2 as _re_linear  # google-re2: linear-time matching, no backtracking
+except ImportError:  # Fall back to the stdlib engine
+    _re_linear = re
+
+from concurrency import forward_tokens
 from llm_client import LLMClient
 from models import DevPlan, DevPlanPhase, ProjectDesign, TaskGroup, DevPlanStep
 from templates import render_template
 
 
+# Every phase header style in one pass: "1. **Phase 1: Title**",
+# "**Phase 1: Title**", "Phase 1: Title" and "## Phase 1 - Title".
+# The bold forms must close their "**"; the others take the rest of the line.
+_PHASE_HEADER_RE = re.compile(
+    r"^(?:(?:\d+\.\s*)?(?P<bold>\*\*)|#{0,6})\s*Phase\s+0*(?P<num>\d+)\s*[:\-–—]\s*"
+    r"(?P<title>.+?)(?(bold)\s*\*\*)\s*$",
+    re.IGNORECASE,
+)
+# The flat parser also accepts a bare numbered list ("1. Title", "1) Title")
+_NUMBERED_ITEM_RE = re.compile(r"^(?P<num>\d+)\s*[\.)]\s*(?P<title>.+)$", re.IGNORECASE)
+
+# Characters a phase/group header can start with (besides digits for
+# phases). Lines starting with anything else, or lacking the keyword,
+# can't match and skip the regexes entirely.
+_PHASE_LEAD = frozenset("*#Pp")
+_GROUP_LEAD = frozenset("-*")
+
+# Phase bullets that carry a summary, or that aren't real items
+_SUMMARY_PREFIXES = ("- Summary:", "- summary:")
+_SKIPPED_ITEM_PREFIXES = ("summary:", "major components:")
+_SKIPPED_ITEM_HEAD = max(map(len, _SKIPPED_ITEM_PREFIXES))
+
+# Every group header style in one pass: the file list comes from an
+# explicit [files] (group 2), an inline files: (group 3), or neither when
+# the header has none. Examples matched:
+# - **Group 1** [estimated_files: src/*, tests/*]
+# - - **Group 1** [files: src/*]
+# - **Group 1** files: src/*
+# - **Group 1**: Setup
+# The lazy ".*?" patterns go through re2 when it is installed, so a long
+# unterminated line or response can't make them backtrack. re2 takes no
+# flags argument, hence the inline (?i)/(?s).
+_GROUP_RE = _re_linear.compile(
+    r'(?i)^-?\s*\*\*?\s*Group\s+(\d+)\s*\*\*?\s*[:\-–—]?\s*'
+    r'(?:\[(?:estimated_)?files\s*[:=]?\s*(.*?)\]\s*$|(?:estimated_)?files\s*[:=]\s*(.*?)\s*$)?'
+)
+
+_JSON_BLOCK_RE = _re_linear.compile(r"(?is)```json\s*(\{.*?\})\s*```")
+_SEP_NORM = re.compile(r"[;|\\]+")
+# Log-entry responses open with a JSON object, possibly after whitespace
+_LOG_ENTRY_START = re.compile(r"\s*\{")
+
+
+def _finalize_group(phase_number_str: str, group: dict, tasks: List[str]) -> TaskGroup:
+    """Build a finished group's TaskGroup, numbering its tasks as steps."""
+    steps: List[dict] = []
+    if tasks:
+        prefix = phase_number_str + "."
+        # Plain dicts: TaskGroup validates the whole list into DevPlanSteps
+        # in one pass, faster than building (or model_construct-ing) each
+        steps = [{"number": prefix + str(i), "description": t} for i, t in enumerate(tasks, 1)]
+    return TaskGroup(
+        group_number=group["number"],
+        description=group["description"],
+        estimated_files=group["files"],
+        steps=steps,
+    )
+
+
+def _load_json_block(text: str) -> Optional[dict]:
+    """Return the plan from a ```json fenced block in text, if it has one."""
+    if "```" not in text:
+        return None
+    m = _JSON_BLOCK_RE.search(text)
+    if m:
+        try:
+            return _json_loads(m.group(1)) or None
+        except Exception:
+            return None
+    return None
+
+
+def _write_debug_dump(response: str) -> None:
+    debug_dir = ".devussy_state"
+    os.makedirs(debug_dir, exist_ok=True)
+    with open(os.path.join(debug_dir, "last_devplan_response.txt"), "w", encoding="utf-8") as f:
+        f.write(response)
+
+
 class BasicDevPlanGenerator:
     """Generate a high-level development plan with phases from a project design."""
 
@@ -73,53 +154,39 @@ class BasicDevPlanGenerator:
 
         streaming_handler = llm_kwargs.pop("streaming_handler", None)
 
-        streaming_enabled = hasattr(self.llm_client, "streaming_enabled") and getattr(self.llm_client, "streaming_enabled", False)
+        streaming_enabled = getattr(self.llm_client, "streaming_enabled", False)
 
         if streaming_enabled and streaming_handler is not None:
             async with streaming_handler:
-                response_chunks: list[str] = []
-
-                def token_callback(token: str) -> None:
-                    response_chunks.append(token)
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        loop = None
-                    if loop and loop.is_running():
-                        loop.create_task(streaming_handler.on_token_async(token))
-                    else:
-                        asyncio.run(streaming_handler.on_token_async(token))
-
-                full_response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
+                async with forward_tokens(streaming_handler) as token_callback:
+                    full_response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
 
                 await streaming_handler.on_completion_async(full_response)
 
             response = full_response
 
         elif streaming_enabled:
-            response = ""
-
-            def token_callback(token: str) -> None:
-                nonlocal response
-                response += token
-
-            response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
+            # Collect tokens in a list; joined only if the client returns nothing
+            chunks: List[str] = []
+            response = await self.llm_client.generate_completion_streaming(prompt, callback=chunks.append, **llm_kwargs)
+            if not response:
+                response = "".join(chunks)
         else:
             response = await self.llm_client.generate_completion(prompt, **llm_kwargs)
 
-        # Save debug copy
-        import os
-        debug_dir = ".devussy_state"
-        if not os.path.exists(debug_dir):
-            os.makedirs(debug_dir)
-        with open(os.path.join(debug_dir, "last_devplan_response.txt"), "w", encoding="utf-8") as f:
-            f.write(response)
-
-        # Parse based on task_grouping mode
-        if self._task_grouping == 'grouped':
-            devplan = self._parse_grouped_response(response, project_design.project_name)
-        else:
-            devplan = self._parse_response(response, project_design.project_name)
+        # Save debug copy (opt-in) from a worker thread, overlapping the parse
+        dump = None
+        if os.environ.get("DEVUSSY_DEBUG_DUMP", "").lower() not in ("", "0", "false", "no"):
+            dump = asyncio.create_task(asyncio.to_thread(_write_debug_dump, response))
+
+        # Parse based on task_grouping mode. Parsing is pure CPU work, so it
+        # runs in a thread rather than stalling other requests on the loop.
+        parse = self._parse_grouped_response if self._task_grouping == 'grouped' else self._parse_response
+        try:
+            devplan = await asyncio.to_thread(parse, response, project_design.project_name)
+        finally:
+            if dump is not None:
+                await dump
         
         devplan.raw_basic_response = response
         return devplan
@@ -138,25 +205,26 @@ class BasicDevPlanGenerator:
         Returns:
             Extracted text content ready for parsing
         """
-        if not response or not response.strip():
-            return response
-        
-        # Quick check: if it doesn't start with '{', it's likely plain text
-        stripped = response.strip()
-        if not stripped.startswith('{'):
+        # Quick check: if it doesn't start with '{', it's likely plain text;
+        # and without a "text" key anywhere no entry can contribute content.
+        # Both checks scan in place rather than copying the response.
+        if '"text"' not in response or not _LOG_ENTRY_START.match(response):
             return response
         
-        # Try to parse as JSON log entries (one per line)
+        # Try to parse as JSON log entries (one per line). Split on '\n'
+        # only: JSON strings may legally hold raw U+2028/U+2029, which
+        # splitlines() would treat as line breaks.
         extracted_parts: List[str] = []
-        lines = response.split('\n')
+        add_part = extracted_parts.append
         
-        for line in lines:
+        for line in response.split('\n'):
             line = line.strip()
-            if not line or not line.startswith('{'):
+            # Only entries mentioning a "text" key can contribute content
+            if not line or not line.startswith('{') or '"text"' not in line:
                 continue
             
             try:
-                entry = json.loads(line)
+                entry = _json_loads(line)
                 # Look for text entries with part.text structure
                 if isinstance(entry, dict):
                     entry_type = entry.get("type", "")
@@ -165,11 +233,11 @@ class BasicDevPlanGenerator:
                     if entry_type == "text" and isinstance(part, dict):
                         text_content = part.get("text", "")
                         if text_content:
-                            extracted_parts.append(text_content)
+                            add_part(text_content)
                     # Also handle direct text field
                     elif "text" in entry and isinstance(entry["text"], str):
-                        extracted_parts.append(entry["text"])
-            except json.JSONDecodeError:
+                        add_part(entry["text"])
+            except ValueError:
                 # Not valid JSON, might be regular text - keep original
                 continue
         
@@ -185,44 +253,39 @@ class BasicDevPlanGenerator:
         response = self._extract_text_from_log_entries(response)
         
         phases = []
-        current_phase = None
-        current_items = []
+        # The open phase; phase_number stays None until the first header
+        phase_number: Optional[int] = None
+        phase_title = ""
+        # Phase bullet items aren't kept (steps come from the detailed
+        # stage); all that matters is whether one has been seen yet
+        has_items = False
         current_description = ""
         next_phase_number = 1
         phase_num = 0
 
-        lines = response.split("\n")
-        phase_patterns = [
-            re.compile(r"^\d+\.\s*\*\*\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+?)\s*\*\*\s*$", re.IGNORECASE),
-            re.compile(r"^\*\*\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+?)\s*\*\*\s*$", re.IGNORECASE),
-            re.compile(r"^Phase\s+0*(\d+)\s*[:\-–—]\s*(.+)$", re.IGNORECASE),
-            re.compile(r"^#{1,6}\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+)$", re.IGNORECASE),
-            re.compile(r"^(\d+)\s*[\.)]\s*(.+)$", re.IGNORECASE),
-        ]
+        # Per-line hot loop: bind bound methods to locals once
+        phase_header = _PHASE_HEADER_RE.match
+        numbered_item = _NUMBERED_ITEM_RE.match
 
-        for line in lines:
+        for line in response.splitlines():
             stripped = line.strip()
+            if not stripped:
+                continue
 
+            lead = stripped[0]
             phase_match = None
-            model_phase_num = None
-            match_title = None
-            for pat in phase_patterns:
-                m = pat.match(stripped)
-                if m:
-                    phase_match = m
-                    try:
-                        model_phase_num = int(m.group(1))
-                        match_title = m.group(2).strip()
-                    except Exception:
-                        phase_match = None
-                        continue
-                    break
+            if lead.isdigit() or lead in _PHASE_LEAD:
+                if "phase" in stripped.casefold():
+                    phase_match = phase_header(stripped)
+                if phase_match is None and lead.isdigit():
+                    phase_match = numbered_item(stripped)
 
             if phase_match:
-                if current_phase is not None:
+                match_title = phase_match["title"].strip()
+                if phase_number is not None:
                     description = current_description.strip()
-                    description = re.sub(r'\*+', '', description)
-                    phases.append(DevPlanPhase(number=(current_phase["number"] if current_phase and "number" in current_phase else 1), title=(current_phase["title"] if current_phase and "title" in current_phase else f"Phase {(current_phase.get('number',1) if isinstance(current_phase, dict) else 1)}"), description=description if description else None, steps=[]))
+                    description = description.replace('*', '')
+                    phases.append(DevPlanPhase(number=phase_number, title=phase_title, description=description if description else None, steps=[]))
 
                 phase_num = next_phase_number
                 next_phase_number += 1
@@ -230,30 +293,28 @@ class BasicDevPlanGenerator:
                 phase_title = match_title or f"Phase {phase_num}"
                 phase_title = phase_title.rstrip("*").strip()
 
-                current_phase = {"number": phase_num, "title": phase_title}
-                current_items = []
+                phase_number = phase_num
+                has_items = False
                 current_description = ""
 
-            elif stripped.startswith("-") and current_phase:
-                if stripped.startswith("- Summary:") or stripped.startswith("- summary:"):
-                    summary_text = stripped.split(":", 1)[1].strip() if ":" in stripped else ""
+            elif lead == "-" and phase_number is not None:
+                if stripped.startswith(_SUMMARY_PREFIXES):
+                    summary_text = stripped.split(":", 1)[1].strip()
                     if summary_text:
                         current_description = summary_text
-                else:
+                elif not has_items:
                     item = stripped[1:].strip()
-                    if item and not item.lower().startswith("summary:") and not item.lower().startswith("major components:"):
-                        current_items.append(item)
+                    # Only the head of the item needs lowering for the prefix test
+                    if item and not item[:_SKIPPED_ITEM_HEAD].lower().startswith(_SKIPPED_ITEM_PREFIXES):
+                        has_items = True
 
-            elif stripped and not stripped.startswith("#") and current_phase and not current_items and not current_description:
-                if current_description:
-                    current_description += " " + stripped
-                else:
-                    current_description = stripped
+            elif lead != "#" and phase_number is not None and not has_items and not current_description:
+                current_description = stripped
 
-        if current_phase is not None:
+        if phase_number is not None:
             description = current_description.strip()
-            description = re.sub(r'\*+', '', description)
-            phases.append(DevPlanPhase(number=(current_phase["number"] if current_phase and "number" in current_phase else 1), title=(current_phase["title"] if current_phase and "title" in current_phase else "Phase 1"), description=description if description else None, steps=[]))
+            description = description.replace('*', '')
+            phases.append(DevPlanPhase(number=phase_number, title=phase_title, description=description if description else None, steps=[]))
 
         if not phases:
             phases.append(DevPlanPhase(number=1, title="Implementation", steps=[]))
@@ -276,26 +337,30 @@ class BasicDevPlanGenerator:
           - Task 3
           - Task 4
         """
-        # Extract text from JSON log entries if present
-        response = self._extract_text_from_log_entries(response)
+        # If the LLM included a machine-readable JSON block, prefer that for
+        # parsing. A block in the raw response means structured output, not
+        # a streaming log, so only look inside log entries when there isn't.
+        json_block = _load_json_block(response)
+        if json_block is None:
+            # Extract text from JSON log entries if present
+            text = self._extract_text_from_log_entries(response)
+            if text is not response:
+                json_block = _load_json_block(text)
+            response = text
         
         phases = []
-        current_phase = None
+        # The open phase; phase_number stays None until the first header.
+        # phase_number_str prefixes the step numbers of its groups.
+        phase_number: Optional[int] = None
+        phase_number_str = ""
+        phase_title = ""
         current_phase_groups = []
         current_group = None
         current_group_tasks = []
-        current_description = ""
+        # Phase description lines seen before the first group
+        description_lines: List[str] = []
         next_phase_number = 1
         phase_num = 0
-        
-        # If the LLM included a machine-readable JSON block, prefer that for parsing.
-        json_block = None
-        m = re.search(r"```json\s*(\{.*?\})\s*```", response, re.S | re.IGNORECASE)
-        if m:
-            try:
-                json_block = json.loads(m.group(1))
-            except Exception:
-                json_block = None
 
         if json_block:
             phases = []
@@ -321,71 +386,33 @@ class BasicDevPlanGenerator:
             summary = f"Development plan for {project_name} with {len(phases)} phases (grouped mode - from JSON)"
             return DevPlan(phases=phases, summary=summary)
 
-        lines = response.split("\n")
-        
-        # Patterns for parsing
-        phase_patterns = [
-            re.compile(r"^\d+\.\s*\*\*\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+?)\s*\*\*\s*$", re.IGNORECASE),
-            re.compile(r"^\*\*\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+?)\s*\*\*\s*$", re.IGNORECASE),
-            re.compile(r"^Phase\s+0*(\d+)\s*[:\-–—]\s*(.+)$", re.IGNORECASE),
-            re.compile(r"^#{1,6}\s*Phase\s+0*(\d+)\s*[:\-–—]\s*(.+)$", re.IGNORECASE),
-        ]
-        
-        # Group pattern: accept several common header styles.
-        # Examples matched:
-        # - **Group 1** [estimated_files: src/*, tests/*]
-        # - - **Group 1** [files: src/*]
-        # - **Group 1** files: src/*
-        # - - Group 1: files=src/*
-        # We try multiple patterns: with explicit [files], with inline files:, or just the group header.
-        group_pattern_bracket = re.compile(
-            r'^-?\s*\*\*?\s*Group\s+(\d+)\s*\*\*?\s*\[(?:estimated_files|files)\s*[:=]?\s*(.*?)\]\s*$',
-            re.IGNORECASE,
-        )
-
-        group_pattern_inline = re.compile(
-            r'^-?\s*\*\*?\s*Group\s+(\d+)\s*\*\*?\s*[:\-–—]?\s*(?:\[(?:estimated_files|files)\s*[:=]?\s*(.*?)\]|(?:files|estimated_files)\s*[:=]\s*(.*?))\s*$',
-            re.IGNORECASE,
-        )
-
-        group_pattern_simple = re.compile(r'^-?\s*\*\*?\s*Group\s+(\d+)\s*\*\*?\s*[:\-–—]?\s*(.*)?$', re.IGNORECASE)
+        # Per-line hot loop: bind bound methods to locals once
+        phase_header = _PHASE_HEADER_RE.match
+        add_task = current_group_tasks.append
         
-        for line in lines:
+        for line in response.splitlines():
             stripped = line.strip()
+            if not stripped:
+                continue
+            
+            lead = stripped[0]
+            is_phase_lead = lead.isdigit() or lead in _PHASE_LEAD
+            low = stripped.casefold() if is_phase_lead or lead in _GROUP_LEAD else ""
             
             # Check for phase header
-            phase_match = None
-            match_title = None
-            for pat in phase_patterns:
-                m = pat.match(stripped)
-                if m:
-                    phase_match = m
-                    try:
-                        match_title = m.group(2).strip()
-                    except Exception:
-                        phase_match = None
-                        continue
-                    break
+            phase_match = phase_header(stripped) if is_phase_lead and "phase" in low else None
             
             if phase_match:
+                match_title = phase_match["title"].strip()
                 # Save previous group and phase
                 if current_group is not None:
-                    # Safely get phase number for step numbering
-                    phase_number_str = str(current_phase["number"]) if current_phase and "number" in current_phase else "1"
-                    current_phase_groups.append(TaskGroup(
-                        group_number=current_group["number"],
-                        description=current_group["description"],
-                        estimated_files=current_group["files"],
-                        steps=[DevPlanStep(number=f"{phase_number_str}.{i+1}", description=t)
-                               for i, t in enumerate(current_group_tasks)]
-                    ))
+                    current_phase_groups.append(_finalize_group(phase_number_str, current_group, current_group_tasks))
                 
-                if current_phase is not None:
-                    description = current_description.strip()
-                    description = re.sub(r'\*+', '', description)
+                if phase_number is not None:
+                    description = " ".join(description_lines).replace('*', '')
                     phases.append(DevPlanPhase(
-                        number=(current_phase["number"] if current_phase and "number" in current_phase else 1),
-                        title=(current_phase["title"] if current_phase and "title" in current_phase else f"Phase {(current_phase['number'] if current_phase and 'number' in current_phase else 1)}"),
+                        number=phase_number,
+                        title=phase_title,
                         description=description if description else None,
                         steps=[],
                         task_groups=current_phase_groups
@@ -397,54 +424,34 @@ class BasicDevPlanGenerator:
                 phase_title = match_title or f"Phase {phase_num}"
                 phase_title = phase_title.rstrip("*").strip()
                 
-                current_phase = {"number": phase_num, "title": phase_title}
+                phase_number = phase_num
+                phase_number_str = str(phase_num)
                 current_phase_groups = []
                 current_group = None
                 current_group_tasks = []
-                current_description = ""
+                add_task = current_group_tasks.append
+                description_lines = []
                 continue
             
-            # Check for group header (try bracketed, then inline, then simple)
+            # Check for group header
             group_match = None
-            files_str = None
-            m = group_pattern_bracket.match(stripped)
-            if m:
-                group_match = m
-                files_str = m.group(2).strip()
-            else:
-                m = group_pattern_inline.match(stripped)
-                if m:
-                    group_match = m
-                    # inline pattern may place files in group 2 or 3 depending on which branch matched
-                    files_str = (m.group(2) or m.group(3) or "").strip()
-                else:
-                    m = group_pattern_simple.match(stripped)
-                    if m:
-                        group_match = m
-                        files_str = ""
+            if lead in _GROUP_LEAD and "group" in low:
+                group_match = _GROUP_RE.match(stripped)
 
             if group_match:
+                files_str = (group_match.group(2) or group_match.group(3) or "").strip()
                 # If we see a group header but no phase yet, create a default phase
-                if current_phase is None:
+                if phase_number is None:
                     phase_num = next_phase_number
                     next_phase_number += 1
-                    current_phase = {"number": phase_num, "title": "Phase 1"}
+                    phase_number = phase_num
+                    phase_number_str = str(phase_num)
+                    phase_title = "Phase 1"
                     current_phase_groups = []
 
                 # Save previous group
                 if current_group is not None:
-                    try:
-                        phase_number_str = str(current_phase.get("number", 1))
-                    except Exception:
-                        phase_number_str = "1"
-                    current_phase_groups.append(TaskGroup(
-                        group_number=current_group["number"],
-                        description=current_group["description"],
-                        estimated_files=current_group["files"],
-                        steps=[DevPlanStep(number=f"{phase_number_str}.{i+1}", description=t)
-                               for i, t in enumerate(current_group_tasks)]
-                    ))
-                # (previous group already saved above if present)
+                    current_phase_groups.append(_finalize_group(phase_number_str, current_group, current_group_tasks))
                 
                 try:
                     group_num = int(group_match.group(1))
@@ -455,7 +462,7 @@ class BasicDevPlanGenerator:
                 file_patterns = []
                 if files_str:
                     # Normalize separators and split
-                    files_str = re.sub(r"[;|\\]+", ",", files_str)
+                    files_str = _SEP_NORM.sub(",", files_str)
                     file_patterns = [f.strip() for f in files_str.split(',') if f.strip()]
                 
                 current_group = {
@@ -464,40 +471,30 @@ class BasicDevPlanGenerator:
                     "files": file_patterns
                 }
                 current_group_tasks = []
+                add_task = current_group_tasks.append
                 continue
             
             # Check for task item (indented under group)
-            if stripped.startswith("-") and current_group is not None:
+            if lead == "-" and current_group is not None:
                 task = stripped[1:].strip()
                 # Filter out group headers that slipped through
                 if task and not task.startswith("**Group"):
-                    current_group_tasks.append(task)
+                    add_task(task)
                 continue
             
             # Description line (between phase header and first group)
-            if stripped and current_phase and current_group is None and not stripped.startswith("#"):
-                if current_description:
-                    current_description += " " + stripped
-                else:
-                    current_description = stripped
+            if phase_number is not None and current_group is None and lead != "#":
+                description_lines.append(stripped)
         
         # Don't forget the last group and phase
         if current_group is not None:
-            phase_number_str = str(current_phase["number"]) if current_phase and "number" in current_phase else "1"
-            current_phase_groups.append(TaskGroup(
-                group_number=current_group["number"],
-                description=current_group["description"],
-                estimated_files=current_group["files"],
-                steps=[DevPlanStep(number=f"{phase_number_str}.{i+1}", description=t)
-                       for i, t in enumerate(current_group_tasks)]
-            ))
+            current_phase_groups.append(_finalize_group(phase_number_str, current_group, current_group_tasks))
         
-        if current_phase is not None:
-            description = current_description.strip()
-            description = re.sub(r'\*+', '', description)
+        if phase_number is not None:
+            description = " ".join(description_lines).replace('*', '')
             phases.append(DevPlanPhase(
-                number=(current_phase["number"] if current_phase and "number" in current_phase else 1),
-                title=(current_phase["title"] if current_phase and "title" in current_phase else "Phase 1"),
+                number=phase_number,
+                title=phase_title,
                 description=description if description else None,
                 steps=[],
                 task_groups=current_phase_groups
@@ -12,7 +12,7 @@ MAX_ITERATIONS = 3
 CONFIDENCE_THRESHOLD = 0.8
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionChange:
     issue_code: str
     action: str
@@ -34,25 +34,41 @@ class DesignCorrectionResult:
 
 
 class DesignCorrectionLoop:
+    # Reviewer confidence a valid design needs to finish the loop
+    confidence_threshold: float = CONFIDENCE_THRESHOLD
+
     def __init__(self) -> None:
         self._validator = DesignValidator()
         self._reviewer = LLMSanityReviewer()
 
     def run(self, design_text: str, complexity_profile: Optional[Any] = None) -> DesignCorrectionResult:
+        """Validate and auto-correct a design until it passes or stops improving.
+
+        Once corrections reach a fixed point (they change nothing, or the
+        next validation reports the same issues again) the loop stops and
+        flags the design for human review instead of repeating itself for
+        the remaining iterations.
+        """
         current_design = design_text
         all_changes: List[CorrectionChange] = []
+        last_issue_codes: Optional[List[str]] = None
 
         for iteration in range(MAX_ITERATIONS):
             validation = self._validator.validate(current_design, complexity_profile=complexity_profile)
             review = self._reviewer.review(current_design, validation)
 
-            if validation.is_valid and review.confidence > CONFIDENCE_THRESHOLD:
+            if validation.is_valid and review.confidence > self.confidence_threshold:
                 return DesignCorrectionResult(design_text=current_design, validation=validation, review=review, changes_made=all_changes, iterations_used=iteration + 1)
 
-            if not validation.auto_correctable:
+            issue_codes = [issue.code for issue in validation.issues]
+            if not validation.auto_correctable or issue_codes == last_issue_codes:
                 return DesignCorrectionResult(design_text=current_design, validation=validation, review=review, requires_human_review=True, changes_made=all_changes, iterations_used=iteration + 1)
+            last_issue_codes = issue_codes
 
-            current_design, changes = self._apply_corrections(current_design, validation, review)
+            new_design, changes = self._apply_corrections(current_design, validation, review)
+            if not changes or new_design == current_design:
+                return DesignCorrectionResult(design_text=current_design, validation=validation, review=review, requires_human_review=True, changes_made=all_changes, iterations_used=iteration + 1)
+            current_design = new_design
             all_changes.extend(changes)
 
         final_validation = self._validator.validate(current_design, complexity_profile=complexity_profile)
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignValidationIssue:
     code: str
     message: str
@@ -15,7 +15,7 @@ class DesignValidationIssue:
     suggestion: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignValidationReport:
     is_valid: bool
     auto_correctable: bool
@@ -29,30 +29,50 @@ class DesignValidationReport:
 
 class DesignValidator:
     REQUIRED_SECTIONS = ["architecture", "database", "testing"]
+    DATABASE_KEYWORDS = ["postgresql", "mysql", "mongodb", "sqlite"]
+    COMPLEXITY_KEYWORDS = ["microservice", "distributed", "kubernetes", "redis", "elasticsearch", "kafka", "rabbitmq", "graphql"]
     OVER_ENGINEERING_KEYWORDS = ["microservice", "kubernetes", "distributed", "event sourcing", "cqrs"]
 
+    # Keywords scanned for in one pass per validation, each only once even
+    # when several checks use it. The scope checks only add theirs for a
+    # minimal profile, the only depth they apply to.
+    _BASE_KEYWORDS = tuple(dict.fromkeys(REQUIRED_SECTIONS + DATABASE_KEYWORDS))
+    _PROFILE_KEYWORDS = tuple(dict.fromkeys(REQUIRED_SECTIONS + DATABASE_KEYWORDS + COMPLEXITY_KEYWORDS + OVER_ENGINEERING_KEYWORDS))
+
+    def __init__(self) -> None:
+        # (design_text, complexity_profile, report) of the last validation,
+        # returned as-is when the same design is validated again
+        self._last: Optional[Tuple[str, Any, DesignValidationReport]] = None
+
     def validate(self, design_text: str, complexity_profile: Optional[Any] = None) -> DesignValidationReport:
+        last = self._last
+        if last is not None and last[1] is complexity_profile and last[0] == design_text:
+            return last[2]
+
         issues: List[DesignValidationIssue] = []
         checks: Dict[str, bool] = {}
+        # Keyword checks are case-insensitive; lower the text once and find
+        # every keyword up front, so the checks only consult the result
+        design_lower = design_text.lower()
+        depth_level = getattr(complexity_profile, "depth_level", None)
+        keywords = self._PROFILE_KEYWORDS if depth_level == "minimal" else self._BASE_KEYWORDS
+        found = {kw for kw in keywords if kw in design_lower}
 
-        checks["completeness"] = self._check_completeness(design_text, issues)
-        checks["consistency"] = self._check_consistency(design_text, issues)
-        checks["scope_alignment"] = self._check_scope_alignment(design_text, complexity_profile, issues)
+        checks["completeness"] = self._check_completeness(found, issues)
+        checks["consistency"] = self._check_consistency(found, issues)
+        checks["scope_alignment"] = self._check_scope_alignment(found, depth_level, issues)
         checks["hallucination"] = self._check_hallucinations(design_text, issues)
-        checks["over_engineering"] = self._check_over_engineering(design_text, complexity_profile, issues)
+        checks["over_engineering"] = self._check_over_engineering(found, depth_level, issues)
 
         is_valid = all(checks.values())
         auto_correctable = all(issue.auto_correctable for issue in issues)
 
-        return DesignValidationReport(is_valid=is_valid, auto_correctable=auto_correctable, issues=issues, checks=checks)
-
-    def _check_completeness(self, design_text: str, issues: List[DesignValidationIssue]) -> bool:
-        design_lower = design_text.lower()
-        missing = []
+        report = DesignValidationReport(is_valid=is_valid, auto_correctable=auto_correctable, issues=issues, checks=checks)
+        self._last = (design_text, complexity_profile, report)
+        return report
 
-        for section in self.REQUIRED_SECTIONS:
-            if section not in design_lower:
-                missing.append(section)
+    def _check_completeness(self, found: Set[str], issues: List[DesignValidationIssue]) -> bool:
+        missing = [section for section in self.REQUIRED_SECTIONS if section not in found]
 
         if missing:
             issues.append(DesignValidationIssue(code="completeness.missing_sections", message=f"Missing required sections: {', '.join(missing)}", auto_correctable=True, severity="warning", suggestion=f"Add sections for: {', '.join(missing)}"))
@@ -60,12 +80,8 @@ class DesignValidator:
 
         return True
 
-    def _check_consistency(self, design_text: str, issues: List[DesignValidationIssue]) -> bool:
-        design_lower = design_text.lower()
-        db_choices = []
-        for db in ["postgresql", "mysql", "mongodb", "sqlite"]:
-            if db in design_lower:
-                db_choices.append(db)
+    def _check_consistency(self, found: Set[str], issues: List[DesignValidationIssue]) -> bool:
+        db_choices = [db for db in self.DATABASE_KEYWORDS if db in found]
 
         if len(db_choices) > 1:
             issues.append(DesignValidationIssue(code="consistency.multiple_databases", message=f"Multiple databases mentioned: {', '.join(db_choices)}", auto_correctable=False, severity="warning", suggestion="Clarify primary database choice"))
@@ -73,13 +89,11 @@ class DesignValidator:
 
         return True
 
-    def _check_scope_alignment(self, design_text: str, complexity_profile: Optional[Any], issues: List[DesignValidationIssue]) -> bool:
-        if complexity_profile is None:
+    def _check_scope_alignment(self, found: Set[str], depth_level: Optional[str], issues: List[DesignValidationIssue]) -> bool:
+        if depth_level != "minimal":
             return True
-        design_lower = design_text.lower()
-        complexity_keywords = ["microservice", "distributed", "kubernetes", "redis", "elasticsearch", "kafka", "rabbitmq", "graphql"]
-        found_keywords = sum(1 for kw in complexity_keywords if kw in design_lower)
-        if getattr(complexity_profile, "depth_level", None) == "minimal" and found_keywords > 2:
+        found_keywords = len(found.intersection(self.COMPLEXITY_KEYWORDS))
+        if found_keywords > 2:
             issues.append(DesignValidationIssue(code="scope_alignment.over_scoped", message="Design complexity exceeds minimal profile", auto_correctable=True, severity="warning", suggestion="Simplify architecture for minimal scope"))
             return False
         return True
@@ -87,16 +101,10 @@ class DesignValidator:
     def _check_hallucinations(self, design_text: str, issues: List[DesignValidationIssue]) -> bool:
         return True
 
-    def _check_over_engineering(self, design_text: str, complexity_profile: Optional[Any], issues: List[DesignValidationIssue]) -> bool:
-        if complexity_profile is None:
+    def _check_over_engineering(self, found: Set[str], depth_level: Optional[str], issues: List[DesignValidationIssue]) -> bool:
+        if depth_level != "minimal":
             return True
-        if getattr(complexity_profile, "depth_level", None) != "minimal":
-            return True
-        design_lower = design_text.lower()
-        found_over_engineering = []
-        for keyword in self.OVER_ENGINEERING_KEYWORDS:
-            if keyword in design_lower:
-                found_over_engineering.append(keyword)
+        found_over_engineering = [keyword for keyword in self.OVER_ENGINEERING_KEYWORDS if keyword in found]
 
         if found_over_engineering:
             issues.append(DesignValidationIssue(code="over_engineering.complex_for_simple", message=f"Over-engineered patterns for minimal project: {', '.join(found_over_engineering)}", auto_correctable=True, severity="warning", suggestion="Simplify architecture for project scale"))
@@ -4,29 +4,27 @@ from __future__ import annotations
 
 import re
 import asyncio
-import sys
-import os
+import hashlib
+import json
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, List, Optional, Callable, Dict
 from textwrap import dedent
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
-# Now import using simple names (works both as package and standalone)
-from concurrency import ConcurrencyManager
+from concurrency import ConcurrencyManager, forward_tokens
 from llm_client import LLMClient
 from models import DevPlan, DevPlanPhase, DevPlanStep, TaskGroup
 from templates import render_template
-from hivemind import HiveMindManager
+from .hivemind import HiveMindManager
 from config import load_config
 
 
+# Step lines ("2.7: Title", "2.7 Title"); the phase part is compared to the
+# phase being parsed, so one pattern serves every phase
+_STEP_RE = re.compile(r"^(\d+)\.(\d+):?\s*(.+)$", re.IGNORECASE)
+_TASK_GROUP_RE = re.compile(r'^-?\s*\*\*\s*Group\s+(\d+)\s*\*\*\s*\[estimated_files:\s*(.*?)\]', re.IGNORECASE)
+
+
 @dataclass
 class PhaseDetailResult:
     phase: DevPlanPhase
@@ -34,11 +32,54 @@ class PhaseDetailResult:
     response_chars: int
 
 
+class _ResponseCache:
+    """In-memory LRU of LLM responses keyed by prompt and call kwargs.
+
+    get/set never await, so concurrent phase tasks can share it without a lock.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def key(prompt: str, llm_kwargs: Dict[str, Any]) -> str:
+        payload = prompt + "|" + json.dumps(llm_kwargs, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+
+    def set(self, key: str, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class DetailedDevPlanGenerator:
     def __init__(self, llm_client: LLMClient, concurrency_manager: ConcurrencyManager):
         self.llm_client = llm_client
         self.concurrency_manager = concurrency_manager
         self.hivemind = HiveMindManager(llm_client)
+        self._config = load_config()
+        cache_config = self._config.response_cache
+        self._response_cache: Optional[_ResponseCache] = (
+            _ResponseCache(cache_config.max_entries)
+            if cache_config.enabled and cache_config.max_entries > 0
+            else None
+        )
+
+    def clear_cache(self) -> None:
+        """Drop every cached phase response."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
 
     async def generate(
         self,
@@ -69,45 +110,54 @@ class DetailedDevPlanGenerator:
             DevPlan with detailed steps (and task_groups if task_grouping='grouped')
         """
         self._task_grouping = task_grouping
-        unique_phases = []
-        seen_numbers: Dict[int, DevPlanPhase] = {}
+        # First phase per number wins; dicts keep first-insertion order
+        phases_by_number: Dict[int, DevPlanPhase] = {}
         for phase in basic_devplan.phases:
-            if phase.number in seen_numbers:
-                continue
-            seen_numbers[phase.number] = phase
-            unique_phases.append(phase)
+            phases_by_number.setdefault(phase.number, phase)
+        unique_phases = list(phases_by_number.values())
 
-        tasks = [
-            asyncio.create_task(self.concurrency_manager.run_with_limit(
-                self._generate_phase_details(
+        async def _detail(phase: DevPlanPhase) -> PhaseDetailResult:
+            async with self.concurrency_manager.acquire():
+                return await self.generate_phase_details(
                     phase, project_name, tech_stack or [], feedback_manager,
                     task_group_size=task_group_size,
                     task_grouping=task_grouping,
                     repo_analysis=repo_analysis,
                     **llm_kwargs
                 )
-            ))
-            for phase in unique_phases
-        ]
+
+        tasks = [asyncio.create_task(_detail(phase)) for phase in unique_phases]
 
         detailed_by_number: Dict[int, DevPlanPhase] = {}
         raw_detailed_responses: Dict[int, str] = {}
 
-        for fut in asyncio.as_completed(tasks):
-            phase_result = await fut
-            detailed_by_number[phase_result.phase.number] = phase_result.phase
-            raw_detailed_responses[phase_result.phase.number] = phase_result.raw_response
-            if on_phase_complete:
-                try:
-                    on_phase_complete(phase_result)
-                except Exception:
-                    pass
+        # The concurrency manager already caps in-flight phases; results are
+        # taken in completion order so progress is reported as it happens.
+        # If a phase fails, the phases still queued or running are cancelled
+        # rather than left to keep calling the LLM for a plan that is lost.
+        try:
+            for fut in asyncio.as_completed(tasks):
+                phase_result = await fut
+                detailed_by_number[phase_result.phase.number] = phase_result.phase
+                raw_detailed_responses[phase_result.phase.number] = phase_result.raw_response
+                if on_phase_complete:
+                    try:
+                        on_phase_complete(phase_result)
+                    except Exception:
+                        pass
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
         detailed_phases = [detailed_by_number[p.number] for p in unique_phases]
 
-        devplan = DevPlan(phases=detailed_phases, summary=basic_devplan.summary)
-        if raw_detailed_responses:
-            devplan.raw_detailed_responses = raw_detailed_responses
+        devplan = DevPlan(
+            phases=detailed_phases,
+            summary=basic_devplan.summary,
+            raw_detailed_responses=raw_detailed_responses,
+        )
 
         if hasattr(basic_devplan, 'raw_basic_response'):
             devplan.raw_basic_response = basic_devplan.raw_basic_response
@@ -117,7 +167,35 @@ class DetailedDevPlanGenerator:
 
         return devplan
 
-    async def _generate_phase_details(
+    async def generate_all_phase_details(
+        self,
+        plan: DevPlan,
+        project_name: str,
+        tech_stack: Optional[List[str]] = None,
+        sem: Optional[asyncio.Semaphore] = None,
+        **llm_kwargs: Any,
+    ) -> List[PhaseDetailResult]:
+        """Detail every phase of ``plan`` concurrently, returning results in phase order.
+        
+        All phase requests are dispatched at once and bounded by ``sem`` when
+        given, otherwise by the ConcurrencyManager. Reuse a single LLM client
+        across calls so its own request semaphore caps the total number of
+        in-flight completions.
+        """
+        coros = [
+            self.generate_phase_details(phase, project_name, tech_stack or [], **llm_kwargs)
+            for phase in plan.phases
+        ]
+        if sem is None:
+            return await self.concurrency_manager.gather_with_limit(coros)
+
+        async def _run(coro):
+            async with sem:
+                return await coro
+
+        return await asyncio.gather(*(_run(c) for c in coros))
+
+    async def generate_phase_details(
         self,
         phase: DevPlanPhase,
         project_name: str,
@@ -152,33 +230,31 @@ class DetailedDevPlanGenerator:
             prompt = feedback_manager.apply_corrections_to_prompt(prompt)
 
         streaming_handler = llm_kwargs.pop("streaming_handler", None)
-        streaming_enabled = hasattr(self.llm_client, "streaming_enabled") and getattr(self.llm_client, "streaming_enabled", False)
+        streaming_enabled = getattr(self.llm_client, "streaming_enabled", False)
 
-        config = load_config()
+        hivemind_config = self._config.hivemind
 
-        if config.hivemind.enabled:
+        if hivemind_config.enabled:
             if streaming_handler:
                 llm_kwargs["streaming_handler"] = streaming_handler
 
-            response = await self.hivemind.run_swarm(prompt, count=config.hivemind.drone_count, temperature_jitter=config.hivemind.temperature_jitter, **llm_kwargs)
+            response = await self.hivemind.run_swarm(prompt, count=hivemind_config.drone_count, temperature_jitter=hivemind_config.temperature_jitter, **llm_kwargs)
             response_used = response
 
         elif streaming_enabled and streaming_handler is not None:
-            response_chunks: list[str] = []
-
-            def token_callback(token: str) -> None:
-                response_chunks.append(token)
-                try:
-                    loop = asyncio.get_running_loop()
-                except RuntimeError:
-                    loop = None
-                if loop and loop.is_running():
-                    loop.create_task(streaming_handler.on_token_async(token))
-
-            response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
+            async with forward_tokens(streaming_handler) as token_callback:
+                response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
             response_used = response
         else:
-            response = await self.llm_client.generate_completion(prompt, **llm_kwargs)
+            # Re-detailing an identical phase (same prompt and kwargs) is
+            # served from memory; sampled (temperature > 0) calls are not
+            cache = self._response_cache if not llm_kwargs.get("temperature") else None
+            cache_key = cache.key(prompt, llm_kwargs) if cache is not None else ""
+            response = cache.get(cache_key) if cache is not None else None
+            if response is None:
+                response = await self.llm_client.generate_completion(prompt, **llm_kwargs)
+                if cache is not None and response.strip():
+                    cache.set(cache_key, response)
             response_used = response
 
         # Parse based on task_grouping mode
@@ -231,21 +307,23 @@ class DetailedDevPlanGenerator:
     def _parse_steps(self, response: str, phase_number: int) -> List[DevPlanStep]:
         steps = []
         lines = response.split("\n")
-        step_pattern = re.compile(rf"^{phase_number}\.(\d+):?\s*(.+)$", re.IGNORECASE)
+        # Only lines starting "<phase>." can be steps of this phase; the
+        # prefix test spares the regex on every bullet and prose line
+        step_prefix = f"{phase_number}."
 
         current_step = None
         current_details = []
 
         for line in lines:
             stripped = line.strip()
-            step_match = step_pattern.match(stripped)
+            step_match = _STEP_RE.match(stripped) if stripped.startswith(step_prefix) else None
 
             if step_match:
                 if current_step is not None:
-                    steps.append(DevPlanStep(number=current_step["number"], description=current_step["description"], details=current_details[:]))
+                    steps.append(DevPlanStep(number=current_step["number"], description=current_step["description"], details=current_details))
 
-                sub_num = int(step_match.group(1))
-                description = step_match.group(2).strip()
+                sub_num = int(step_match.group(2))
+                description = step_match.group(3).strip()
 
                 current_step = {"number": f"{phase_number}.{sub_num}", "description": description}
                 current_details = []
@@ -256,7 +334,7 @@ class DetailedDevPlanGenerator:
                     current_details.append(detail)
 
         if current_step is not None:
-            steps.append(DevPlanStep(number=current_step["number"], description=current_step["description"], details=current_details[:]))
+            steps.append(DevPlanStep(number=current_step["number"], description=current_step["description"], details=current_details))
 
         if not steps:
             steps.append(DevPlanStep(number=f"{phase_number}.1", description="Implement phase requirements"))
@@ -279,33 +357,24 @@ class DetailedDevPlanGenerator:
         """
         groups = []
         lines = response.split("\n")
-        
-        # Patterns
-        group_pattern = re.compile(
-            r'^-?\s*\*\*\s*Group\s+(\d+)\s*\*\*\s*\[estimated_files:\s*(.*?)\]',
-            re.IGNORECASE
-        )
-        step_pattern = re.compile(rf'^{phase_number}\.(\d+):?\s*(.+)$', re.IGNORECASE)
+        step_prefix = f"{phase_number}."
         
         current_group = None
+        # Steps are kept as plain dicts; TaskGroup validates the whole list
+        # into DevPlanSteps when the group is built
         current_steps = []
         current_step = None
-        current_details = []
         group_num = 0
         
         for line in lines:
             stripped = line.strip()
             
             # Check for group header
-            group_match = group_pattern.match(stripped)
+            group_match = _TASK_GROUP_RE.match(stripped)
             if group_match:
                 # Save previous step to current_steps
                 if current_step is not None:
-                    current_steps.append(DevPlanStep(
-                        number=current_step["number"],
-                        description=current_step["description"],
-                        details=current_details[:]
-                    ))
+                    current_steps.append(current_step)
                 
                 # Save previous group
                 if current_group is not None and current_steps:
@@ -327,43 +396,34 @@ class DetailedDevPlanGenerator:
                 }
                 current_steps = []
                 current_step = None
-                current_details = []
                 continue
             
             # Check for step header
-            step_match = step_pattern.match(stripped)
+            step_match = _STEP_RE.match(stripped) if stripped.startswith(step_prefix) else None
             if step_match:
                 # Save previous step
                 if current_step is not None:
-                    current_steps.append(DevPlanStep(
-                        number=current_step["number"],
-                        description=current_step["description"],
-                        details=current_details[:]
-                    ))
+                    current_steps.append(current_step)
                 
-                sub_num = int(step_match.group(1))
-                description = step_match.group(2).strip()
+                sub_num = int(step_match.group(2))
+                description = step_match.group(3).strip()
                 
                 current_step = {
                     "number": f"{phase_number}.{sub_num}",
-                    "description": description
+                    "description": description,
+                    "details": []
                 }
-                current_details = []
                 continue
             
             # Check for detail bullet
             if stripped.startswith("-") and current_step is not None:
                 detail = stripped[1:].strip()
                 if detail:
-                    current_details.append(detail)
+                    current_step["details"].append(detail)
         
         # Don't forget the last step and group
         if current_step is not None:
-            current_steps.append(DevPlanStep(
-                number=current_step["number"],
-                description=current_step["description"],
-                details=current_details[:]
-            ))
+            current_steps.append(current_step)
         
         if current_group is not None and current_steps:
             groups.append(TaskGroup(
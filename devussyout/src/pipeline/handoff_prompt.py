@@ -2,19 +2,9 @@
 
 from __future__ import annotations
 
+from itertools import islice
 from typing import Any, Dict, List
-import sys
-import os
-
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
-# Now import using simple names (works both as package and standalone)
+
 from models import DevPlan, HandoffPrompt
 from templates import render_template
 try:
@@ -25,7 +15,6 @@ except ImportError:
 
 class HandoffPromptGenerator:
     def generate(self, devplan: DevPlan, project_name: str, project_summary: str = "", architecture_notes: str = "", dependencies_notes: str = "", config_notes: str = "", task_group_size: int = 5, repo_analysis: Any = None, **kwargs: Any,) -> HandoffPrompt:
-        completed_phases = [p for p in devplan.phases if self._is_phase_complete(p)]
         in_progress_phase = self._get_in_progress_phase(devplan.phases)
         next_steps = self._get_next_steps(devplan.phases, limit=task_group_size)
 
@@ -81,13 +70,6 @@ class HandoffPromptGenerator:
         return None
 
     def _get_next_steps(self, phases: List[DevPlanPhase], limit: int = 5) -> List[Dict[str, Any]]:
-        next_steps = []
-
-        for phase in phases:
-            for step in phase.steps:
-                if not step.done:
-                    next_steps.append({"number": step.number, "title": step.description[:80], "description": step.description, "notes": None})
-                    if len(next_steps) >= limit:
-                        return next_steps
-
-        return next_steps
+        pending = (step for phase in phases for step in phase.steps if not step.done)
+        # At least one step is always returned when any remain
+        return [{"number": step.number, "title": step.description[:80], "description": step.description, "notes": None} for step in islice(pending, max(limit, 1))]
@@ -2,19 +2,9 @@
 
 import asyncio
 import logging
-import sys
-import os
 from typing import List, Optional, Any, Dict
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
-# Now import using simple names (works both as package and standalone)
+from concurrency import forward_tokens
 from llm_client import LLMClient
 from templates import render_template
 
@@ -27,34 +17,54 @@ class HiveMindManager:
 
     async def run_swarm(self, prompt: str, count: int = 3, temperature_jitter: bool = True, base_temperature: float = 0.7, drone_callbacks: Optional[List[Any]] = None, arbiter_callback: Optional[Any] = None, **llm_kwargs: Any) -> str:
         drone_responses = await self._execute_parallel(prompt, count, temperature_jitter, base_temperature, drone_callbacks=drone_callbacks, **llm_kwargs)
-        arbiter_prompt = self._format_for_arbiter(prompt, drone_responses)
+        # Identical drone outputs add nothing for the arbiter to weigh; if
+        # every drone converged on one answer, there is nothing to arbitrate
+        unique_responses = list({response.strip(): response for response in drone_responses}.values())
+        if len(unique_responses) == 1 and unique_responses[0].strip():
+            final_response = unique_responses[0]
+            if arbiter_callback:
+                await arbiter_callback.on_token_async(final_response)
+                await arbiter_callback.on_completion_async(final_response)
+            return final_response
+        arbiter_prompt = self._format_for_arbiter(prompt, unique_responses)
         final_response = await self._call_arbiter(arbiter_prompt, arbiter_callback=arbiter_callback, **llm_kwargs)
         return final_response
 
     async def _execute_parallel(self, prompt: str, count: int, temperature_jitter: bool, base_temperature: float, drone_callbacks: Optional[List[Any]] = None, **llm_kwargs: Any) -> List[str]:
-        async def execute_drone(i: int):
-            if temperature_jitter and count > 1:
-                offset = (i / (count - 1) - 0.5) * 0.4 if count > 1 else 0
-                temp = max(0.0, min(2.0, base_temperature + offset))
-            else:
-                temp = base_temperature
+        # Jittered temperatures spread evenly over base_temperature +/- 0.2
+        if temperature_jitter and count > 1:
+            temps = [max(0.0, min(2.0, base_temperature + (i / (count - 1) - 0.5) * 0.4)) for i in range(count)]
+        else:
+            temps = [base_temperature] * count
+
+        # Drones are independent samples of the same prompt; the client must
+        # not coalesce them into one request or serve them from its cache
+        shared_kwargs = {k: v for k, v in llm_kwargs.items() if k not in ("streaming_handler", "independent")}
 
-            drone_kwargs = llm_kwargs.copy()
-            drone_kwargs["temperature"] = temp
-            if "streaming_handler" in drone_kwargs:
-                del drone_kwargs["streaming_handler"]
+        async def execute_drone(i: int):
+            drone_kwargs = {**shared_kwargs, "temperature": temps[i]}
 
             callback = drone_callbacks[i] if drone_callbacks and i < len(drone_callbacks) else None
 
             if callback:
-                response = await self.llm_client.generate_completion_streaming(prompt, callback=callback.on_token_async, **drone_kwargs)
+                async with forward_tokens(callback) as token_callback:
+                    response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, independent=True, **drone_kwargs)
                 await callback.on_completion_async(response)
                 return response
             else:
-                response = await self.llm_client.generate_completion(prompt, **drone_kwargs)
+                response = await self.llm_client.generate_completion(prompt, independent=True, **drone_kwargs)
                 return response
 
-        drone_responses = await asyncio.gather(*[execute_drone(i) for i in range(count)])
+        # A failed drone doesn't discard the others' answers; the swarm only
+        # fails when no drone produced one
+        results = await asyncio.gather(*[execute_drone(i) for i in range(count)], return_exceptions=True)
+        drone_responses = [result for result in results if not isinstance(result, BaseException)]
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures and not drone_responses:
+            raise failures[0]
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.warning("HiveMind drone %d of %d failed: %r", i + 1, count, result)
         return drone_responses
 
     def _format_for_arbiter(self, original_prompt: str, drone_responses: List[str]) -> str:
@@ -66,13 +76,12 @@ class HiveMindManager:
         return render_template("hivemind_arbiter.jinja", context)
 
     async def _call_arbiter(self, prompt: str, arbiter_callback: Optional[Any] = None, **llm_kwargs: Any) -> str:
-        arbiter_kwargs = llm_kwargs.copy()
+        arbiter_kwargs = {k: v for k, v in llm_kwargs.items() if k != "streaming_handler"}
         arbiter_kwargs["temperature"] = 0.2
-        if "streaming_handler" in arbiter_kwargs:
-            del arbiter_kwargs["streaming_handler"]
 
         if arbiter_callback:
-            response = await self.llm_client.generate_completion_streaming(prompt, callback=arbiter_callback.on_token_async, **arbiter_kwargs)
+            async with forward_tokens(arbiter_callback) as token_callback:
+                response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **arbiter_kwargs)
             await arbiter_callback.on_completion_async(response)
             return response
         else:
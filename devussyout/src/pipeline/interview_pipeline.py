@@ -2,26 +2,18 @@
 
 This module integrates the interview system with the existing pipeline stages,
 providing a conversational interface to the entire devplan generation process.
+
+Run standalone from ``src/`` with ``python -m pipeline.interview_pipeline``.
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
-import os
-import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
 # Import interview components
 from interview.conversation_history import ConversationHistory, MessageRole
 from interview.json_extractor import JSONExtractor
@@ -36,10 +28,10 @@ from concurrency import ConcurrencyManager
 from templates import render_template
 
 # Import existing pipeline generators
-from project_design import ProjectDesignGenerator
-from basic_devplan import BasicDevPlanGenerator
-from detailed_devplan import DetailedDevPlanGenerator
-from handoff_prompt import HandoffPromptGenerator
+from .project_design import ProjectDesignGenerator
+from .basic_devplan import BasicDevPlanGenerator
+from .detailed_devplan import DetailedDevPlanGenerator
+from .handoff_prompt import HandoffPromptGenerator
 
 
 class InterviewPipeline:
@@ -181,6 +173,30 @@ class InterviewPipeline:
         
         self._notify_progress("design", 0.25, "Design complete")
         
+        # Write the requirements and design while the remaining stages run;
+        # the plan files follow once they are done
+        self._create_output_dir(project_name)
+        design_saved = asyncio.create_task(self._write_outputs(self._design_outputs()))
+        try:
+            await self._run_plan_stages(project_name, languages, task_grouping, **kwargs)
+        finally:
+            await design_saved
+        
+        await self._write_outputs(self._plan_outputs())
+        
+        self._notify_progress("complete", 1.0, "Pipeline complete!")
+        
+        return InterviewResult(
+            project_name=project_name,
+            requirements=self._requirements,
+            design=self._design,
+            devplan=self._devplan,
+            handoff=self._handoff,
+            output_dir=self._output_dir,
+        )
+    
+    async def _run_plan_stages(self, project_name: str, languages: List[str], task_grouping: str, **kwargs: Any) -> None:
+        """Run the basic devplan, detailed and handoff stages on the current design."""
         # Stage 2: Generate basic devplan
         self._notify_progress("devplan", 0.3, "Generating development plan...")
         
@@ -222,20 +238,6 @@ class InterviewPipeline:
         )
         
         self._notify_progress("handoff", 0.95, "Handoff complete")
-        
-        # Save outputs
-        await self._save_outputs(project_name)
-        
-        self._notify_progress("complete", 1.0, "Pipeline complete!")
-        
-        return InterviewResult(
-            project_name=project_name,
-            requirements=self._requirements,
-            design=self._design,
-            devplan=self._devplan,
-            handoff=self._handoff,
-            output_dir=self._output_dir,
-        )
     
     async def start_interactive(self, initial_message: Optional[str] = None) -> InterviewManager:
         """Start interactive interview mode.
@@ -303,38 +305,44 @@ class InterviewPipeline:
             output_dir=self._output_dir,
         )
     
-    async def _save_outputs(self, project_name: str) -> None:
-        """Save all outputs to files."""
+    def _create_output_dir(self, project_name: str) -> None:
+        """Create the timestamped directory this run's outputs are saved to."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._output_dir = self.save_dir / f"{project_name}_{timestamp}"
         self._output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _design_outputs(self) -> Dict[str, str]:
+        """Serialize the requirements and design, keyed by file name."""
+        outputs = {"requirements.json": json.dumps(self._requirements, indent=2)}
         
-        # Save requirements
-        with open(self._output_dir / "requirements.json", "w") as f:
-            json.dump(self._requirements, f, indent=2)
-        
-        # Save design
         if self._design:
-            with open(self._output_dir / "design.json", "w") as f:
-                f.write(self._design.to_json())
+            outputs["design.json"] = self._design.to_json()
             
             # Also save raw response if available
             if self._design.raw_llm_response:
-                with open(self._output_dir / "design.md", "w") as f:
-                    f.write(self._design.raw_llm_response)
+                outputs["design.md"] = self._design.raw_llm_response
+        
+        return outputs
+    
+    def _plan_outputs(self) -> Dict[str, str]:
+        """Serialize the devplan and handoff, keyed by file name."""
+        outputs: Dict[str, str] = {}
         
-        # Save devplan
         if self._devplan:
-            with open(self._output_dir / "devplan.json", "w") as f:
-                f.write(self._devplan.to_json())
+            outputs["devplan.json"] = self._devplan.to_json()
         
-        # Save handoff
         if self._handoff:
-            with open(self._output_dir / "handoff.md", "w") as f:
-                f.write(self._handoff.content)
-            
-            with open(self._output_dir / "handoff.json", "w") as f:
-                f.write(self._handoff.to_json())
+            outputs["handoff.md"] = self._handoff.content
+            outputs["handoff.json"] = self._handoff.to_json()
+        
+        return outputs
+    
+    async def _write_outputs(self, outputs: Dict[str, str]) -> None:
+        """Write serialized outputs into the output directory, one thread per file."""
+        await asyncio.gather(*(
+            asyncio.to_thread((self._output_dir / name).write_text, text)
+            for name, text in outputs.items()
+        ))
 
 
 async def run_pipeline_cli(
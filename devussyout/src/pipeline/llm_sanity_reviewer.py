@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import List, Any
+from typing import List, Any, Optional, Tuple
 
 
 @dataclass
@@ -52,7 +52,16 @@ class LLMSanityReviewResultDetailed:
 
 
 class LLMSanityReviewer:
+    def __init__(self) -> None:
+        # (design_text, validation_report, result) of the last review,
+        # returned as-is when the same design and report come back
+        self._last: Optional[Tuple[str, Any, LLMSanityReviewResult]] = None
+
     def review(self, design_text: str, validation_report: Any) -> LLMSanityReviewResult:
+        last = self._last
+        if last is not None and last[1] is validation_report and last[0] == design_text:
+            return last[2]
+
         if validation_report.is_valid:
             confidence = 0.9
             notes = "Design passes all rule-based checks."
@@ -66,4 +75,6 @@ class LLMSanityReviewer:
             notes = "Design has validation issues; manual review recommended."
             risks = [issue.code for issue in validation_report.issues]
 
-        return LLMSanityReviewResult(confidence=confidence, notes=notes, risks=risks)
+        result = LLMSanityReviewResult(confidence=confidence, notes=notes, risks=risks)
+        self._last = (design_text, validation_report, result)
+        return result
@@ -4,22 +4,25 @@ from __future__ import annotations
 
 from typing import Any, List, Optional
 import asyncio
-import sys
-import os
-
-# Set up paths for standalone execution
-_this_dir = os.path.dirname(os.path.abspath(__file__))
-_parent_dir = os.path.dirname(_this_dir)
-if _this_dir not in sys.path:
-    sys.path.insert(0, _this_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
-
-# Now import using simple names (works both as package and standalone)
+import re
+
+from concurrency import forward_tokens
 from llm_client import LLMClient
 from models import ProjectDesign
 from templates import render_template
 
+# Header keyword -> section, checked in order against the lowercased header
+_SECTION_KEYWORDS = (
+    ("objective", "objectives"),
+    ("technology stack", "tech_stack"),
+    ("architecture", "architecture"),
+    ("dependencies", "dependencies"),
+    ("challenge", "challenges"),
+    ("complexity", "complexity"),
+)
+_NUMBER_RE = re.compile(r"\d+")
+_MITIGATION_KEYWORDS = ("mitigation", "solution", "address")
+
 
 class ProjectDesignGenerator:
     """Generate a structured project design document using an LLM."""
@@ -42,30 +45,23 @@ class ProjectDesignGenerator:
 
         streaming_handler = llm_kwargs.pop("streaming_handler", None)
 
-        streaming_enabled = hasattr(self.llm_client, "streaming_enabled") and getattr(self.llm_client, "streaming_enabled", False)
+        streaming_enabled = getattr(self.llm_client, "streaming_enabled", False)
 
         if streaming_enabled and streaming_handler is not None:
             async with streaming_handler:
-                response_chunks: list[str] = []
-
-                async def token_callback(token: str) -> None:
-                    response_chunks.append(token)
-                    await streaming_handler.on_token_async(token)
-
-                full_response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
+                async with forward_tokens(streaming_handler) as token_callback:
+                    full_response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
 
                 await streaming_handler.on_completion_async(full_response)
 
             response = full_response
 
         elif streaming_enabled:
-            response = ""
-
-            def token_callback(token: str) -> None:
-                nonlocal response
-                response += token
-
-            response = await self.llm_client.generate_completion_streaming(prompt, callback=token_callback, **llm_kwargs)
+            # Collect tokens in a list; joined only if the client returns nothing
+            chunks: List[str] = []
+            response = await self.llm_client.generate_completion_streaming(prompt, callback=chunks.append, **llm_kwargs)
+            if not response:
+                response = "".join(chunks)
         else:
             response = await self.llm_client.generate_completion(prompt, **llm_kwargs)
 
@@ -80,6 +76,10 @@ class ProjectDesignGenerator:
         challenges = []
         mitigations = []
         architecture_overview = None
+        # Set only once an architecture header is seen
+        architecture_lines: Optional[List[str]] = None
+        complexity: Optional[str] = None
+        estimated_phases: Optional[int] = None
 
         lines = response.split("\n")
         current_section = None
@@ -87,27 +87,11 @@ class ProjectDesignGenerator:
         for line in lines:
             stripped = line.strip()
 
-            if "objective" in stripped.lower() and stripped.startswith("#"):
-                current_section = "objectives"
-                continue
-            elif "technology stack" in stripped.lower() and stripped.startswith("#"):
-                current_section = "tech_stack"
-                continue
-            elif "architecture" in stripped.lower() and stripped.startswith("#"):
-                current_section = "architecture"
-                architecture_lines = []
-                continue
-            elif "dependencies" in stripped.lower() and stripped.startswith("#"):
-                current_section = "dependencies"
-                continue
-            elif "challenge" in stripped.lower() and stripped.startswith("#"):
-                current_section = "challenges"
-                continue
-            elif "complexity" in stripped.lower() and stripped.startswith("#"):
-                current_section = "complexity"
-                continue
-            elif stripped.startswith("#"):
-                current_section = None
+            if stripped.startswith("#"):
+                header = stripped.lower()
+                current_section = next((section for keyword, section in _SECTION_KEYWORDS if keyword in header), None)
+                if current_section == "architecture":
+                    architecture_lines = []
                 continue
 
             if current_section and stripped.startswith("-"):
@@ -120,7 +104,8 @@ class ProjectDesignGenerator:
                     elif current_section == "dependencies":
                         dependencies.append(content)
                     elif current_section == "challenges":
-                        if any(kw in content.lower() for kw in ["mitigation", "solution", "address"]):
+                        lower_content = content.lower()
+                        if any(kw in lower_content for kw in _MITIGATION_KEYWORDS):
                             mitigations.append(content)
                         else:
                             challenges.append(content)
@@ -133,17 +118,14 @@ class ProjectDesignGenerator:
                         elif "estimated phases" in lower_content:
                             parts = content.split(":", 1)
                             if len(parts) > 1:
-                                val_str = parts[1].strip()
-                                import re
-                                num_match = re.search(r'\d+', val_str)
+                                num_match = _NUMBER_RE.search(parts[1])
                                 if num_match:
                                     estimated_phases = int(num_match.group(0))
 
             elif current_section == "architecture" and stripped:
-                if not stripped.startswith("#"):
-                    architecture_lines.append(stripped)
+                architecture_lines.append(stripped)
 
-        if "architecture_lines" in locals():
+        if architecture_lines is not None:
             architecture_overview = "\n".join(architecture_lines)
 
         if not architecture_overview and response:
@@ -159,6 +141,6 @@ class ProjectDesignGenerator:
             dependencies=dependencies if dependencies else [],
             challenges=challenges if challenges else [],
             mitigations=mitigations if mitigations else [],
-            complexity=locals().get("complexity"),
-            estimated_phases=locals().get("estimated_phases"),
+            complexity=complexity,
+            estimated_phases=estimated_phases,
         )
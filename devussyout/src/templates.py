@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
+from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib codec
+    orjson = None  # type: ignore
 
 
 def _templates_dir() -> Path:
@@ -14,47 +22,87 @@ def _templates_dir() -> Path:
     return Path(__file__).resolve().parents[1] / "templates"
 
 
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() not in ("", "0", "false", "no")
+
+
+def _reload_enabled() -> bool:
+    # Set DEVUSSY_TEMPLATE_RELOAD while editing templates to pick up changes
+    # without restarting
+    return _env_flag("DEVUSSY_TEMPLATE_RELOAD")
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    # Compiled templates are kept in Jinja's per-user cache directory, keyed
+    # by source checksum, so each process skips parsing unchanged templates.
+    # Without a usable directory templates are just compiled per process.
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
 @lru_cache(maxsize=1)
 def _env() -> Environment:
     loader = FileSystemLoader(str(_templates_dir()))
-    env = Environment(loader=loader, autoescape=False, trim_blocks=True, lstrip_blocks=True)
+    # Templates don't change under a running pipeline; without auto_reload
+    # the macro files imported on every render aren't stat()ed each time
+    env = Environment(
+        loader=loader,
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=_reload_enabled(),
+        cache_size=-1,
+        bytecode_cache=_bytecode_cache(),
+    )
     env.globals["enumerate"] = enumerate
     env.globals["len"] = len
     return env
 
 
+@lru_cache(maxsize=None)
 def load_template(name: str) -> Template:
-    tpl = _env().get_template(name)
-    return tpl
+    # Keep the compiled Template per name, so repeat renders skip Jinja's
+    # loader lookup and up-to-date check
+    return _env().get_template(name)
 
 
-def render_template(name: str, context: dict[str, Any]) -> str:
+def _sample_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
     try:
-        import json
-        from datetime import datetime
+        return obj.model_dump()
+    except AttributeError:
+        pass
+    try:
+        return obj.dict()
+    except AttributeError:
+        pass
+    return str(obj)
+
 
+def _dump_sample(name: str, context: dict[str, Any]) -> None:
+    """Save the context a template was rendered with to DevDocs/JINJA_DATA_SAMPLES."""
+    try:
         log_dir = Path(__file__).resolve().parents[1] / "DevDocs" / "JINJA_DATA_SAMPLES"
         log_dir.mkdir(parents=True, exist_ok=True)
 
         safe_name = name.replace("/", "_").replace("\\", "_")
-        log_file = log_dir / f"{safe_name}.json"
-
-        def default_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            try:
-                return obj.model_dump()
-            except AttributeError:
-                pass
-            try:
-                return obj.dict()
-            except AttributeError:
-                pass
-            return str(obj)
-
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(context, f, indent=2, default=default_serializer)
+        if orjson is not None:
+            data = orjson.dumps(context, default=_sample_default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(context, indent=2, default=_sample_default).encode("utf-8")
+        (log_dir / f"{safe_name}.json").write_bytes(data)
     except Exception:
         pass
 
-    return load_template(name).render(**context)
+
+def render_template(name: str, context: dict[str, Any]) -> str:
+    # Context samples are a debugging aid; writing one on every render is
+    # opt-in through the same switch as the other debug dumps
+    if _env_flag("DEVUSSY_DEBUG_DUMP"):
+        _dump_sample(name, context)
+
+    template = _env().get_template(name) if _env().auto_reload else load_template(name)
+    return template.render(**context)
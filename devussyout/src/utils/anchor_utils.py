@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Optional
 
@@ -14,10 +15,15 @@ def _anchor_pair(anchor_name: str) -> tuple[str, str]:
     return start, end
 
 
-def extract_between_anchors(content: str, anchor_name: str, *, raise_on_missing: bool = False) -> Optional[str]:
+@lru_cache(maxsize=128)
+def _anchor_section_re(anchor_name: str) -> re.Pattern[str]:
+    # Matches a whole anchored section; group 1 is the text between anchors
     start, end = _anchor_pair(anchor_name)
-    pattern = f"{re.escape(start)}(.*?){re.escape(end)}"
-    match = re.search(pattern, content, re.DOTALL)
+    return re.compile(f"{re.escape(start)}(.*?){re.escape(end)}", re.DOTALL)
+
+
+def extract_between_anchors(content: str, anchor_name: str, *, raise_on_missing: bool = False) -> Optional[str]:
+    match = _anchor_section_re(anchor_name).search(content)
     if not match:
         if raise_on_missing:
             raise ValueError(f"Anchors for {anchor_name!r} not found")
@@ -29,9 +35,11 @@ def replace_anchor_content(content: str, anchor_name: str, new_content: str) ->
     start, end = _anchor_pair(anchor_name)
     new_section = f"{start}\n{new_content}\n{end}"
 
-    pattern = f"{re.escape(start)}.*?{re.escape(end)}"
-    if re.search(pattern, content, re.DOTALL):
-        return re.sub(pattern, new_section, content, flags=re.DOTALL)
+    # A callable replacement inserts new_section literally; as a template
+    # string its backslashes would be read as escapes and group references
+    replaced, count = _anchor_section_re(anchor_name).subn(lambda _match: new_section, content)
+    if count:
+        return replaced
 
     sep = "\n\n" if not content.endswith("\n") else "\n"
     return f"{content}{sep}{new_section}\n"